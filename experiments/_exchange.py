@@ -0,0 +1,153 @@
+"""
+Shared CCXT exchange handle for the experiment scripts.
+
+Building a ``ccxt.binance`` client opens a new aiohttp session and downloads
+the full market list, so experiments share one warm instance instead.
+"""
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import ccxt.async_support as ccxt
+from dotenv import load_dotenv
+
+load_dotenv()
+
+API_KEY = os.getenv("BINANCE_API_KEY")
+API_SECRET = os.getenv("BINANCE_API_SECRET")
+
+CACHE_DIR = Path("data/cache")
+MARKETS_TTL_SECONDS = 3600  # markets rarely change intraday
+
+_exchange = None
+
+
+@dataclass(frozen=True, slots=True)
+class MarketView:
+    """Flat view of the CCXT market fields used for order validation."""
+
+    symbol: str
+    min_amount: float | None
+    max_amount: float | None
+    min_cost: float | None
+    price_precision: float | None
+    amount_precision: float | None
+
+    @classmethod
+    def from_market(cls, market):
+        """Build from a raw ``exchange.markets[symbol]`` dict."""
+        limits = market['limits']
+        precision = market['precision']
+        return cls(
+            symbol=market['symbol'],
+            min_amount=limits['amount']['min'],
+            max_amount=limits['amount']['max'],
+            min_cost=limits['cost']['min'],
+            price_precision=precision['price'],
+            amount_precision=precision['amount'],
+        )
+
+
+async def load_markets_cached(exchange, ttl=MARKETS_TTL_SECONDS, force_reload=False):
+    """Load markets from an on-disk cache, fetching live only when stale.
+
+    Args:
+        exchange: CCXT exchange instance
+        ttl: Maximum cache age in seconds
+        force_reload: Skip the cache and always fetch from the exchange
+    """
+    cache_path = CACHE_DIR / f"{exchange.id}_markets.json"
+
+    if not force_reload and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text())
+            if time.time() - cached["ts"] < ttl:
+                exchange.set_markets(cached["markets"], cached["currencies"])
+                return exchange.markets
+        except (ValueError, KeyError):
+            pass  # Corrupt cache - fall through to a live fetch
+
+    await exchange.load_markets(reload=force_reload)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps({
+        "ts": time.time(),
+        "markets": exchange.markets,
+        "currencies": exchange.currencies,
+    }))
+    return exchange.markets
+
+
+async def gather_bounded(coros, concurrency=10):
+    """Like asyncio.gather, but with at most ``concurrency`` awaitables in flight."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros))
+
+
+async def fetch_ohlcv_range(
+    exchange, symbol, start_ms, end_ms, timeframe='1m', limit=1000, concurrency=10
+):
+    """Fetch all candles in ``[start_ms, end_ms)`` with concurrent paged requests.
+
+    Page start times are known up front, so pages are fetched in parallel
+    (bounded, and paced by CCXT's throttler) instead of one after another.
+    Returns candles sorted by timestamp with duplicates removed.
+    """
+    timeframe_ms = exchange.parse_timeframe(timeframe) * 1000
+    page_ms = limit * timeframe_ms
+    pages = await gather_bounded(
+        (
+            exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
+            for since in range(start_ms, end_ms, page_ms)
+        ),
+        concurrency=concurrency,
+    )
+    by_ts = {c[0]: c for page in pages for c in page if start_ms <= c[0] < end_ms}
+    return [by_ts[ts] for ts in sorted(by_ts)]
+
+
+@asynccontextmanager
+async def binance_client(force_reload=False):
+    """Yield a shared Binance client with markets already loaded.
+
+    The first (outermost) caller creates the client and closes it on exit;
+    nested callers reuse the same instance. Markets come from the on-disk
+    cache unless it is stale or ``force_reload`` is set.
+    """
+    global _exchange
+
+    if _exchange is not None:
+        yield _exchange
+        return
+
+    exchange = ccxt.binance({
+        'apiKey': API_KEY,
+        'secret': API_SECRET,
+        'enableRateLimit': True,
+        # Binance allows ~20 weight-1 requests/s; pace at that rate and let
+        # short bursts through instead of serializing every call
+        'rateLimit': 50,
+        'tokenBucket': {'capacity': 10},
+        'options': {
+            'defaultType': 'spot',  # spot trading
+            'warnOnFetchOpenOrdersWithoutSymbol': False,
+        }
+    })
+
+    try:
+        await load_markets_cached(exchange, force_reload=force_reload)
+        _exchange = exchange
+        yield exchange
+    finally:
+        _exchange = None
+        await exchange.close()
@@ -10,59 +10,44 @@ Experiments with CCXT to understand:
 """
 
 import asyncio
-import os
+import time
 from datetime import UTC, datetime
+from itertools import pairwise
 
-import ccxt.async_support as ccxt
-from dotenv import load_dotenv
+from _exchange import API_KEY, API_SECRET, MarketView, binance_client, fetch_ohlcv_range
 
-load_dotenv()
 
-API_KEY = os.getenv("BINANCE_API_KEY")
-API_SECRET = os.getenv("BINANCE_API_SECRET")
+def fmt_ts(ms, fmt='%Y-%m-%dT%H:%M:%SZ'):
+    """Format a millisecond UTC timestamp for display without building datetimes."""
+    return time.strftime(fmt, time.gmtime(ms // 1000))
 
 
-async def test_exchange_setup():
+async def test_exchange_setup(exchange):
     """Test basic exchange connection and markets."""
     print("=" * 60)
     print("1. EXCHANGE SETUP & MARKETS")
     print("=" * 60)
 
-    exchange = ccxt.binance({
-        'apiKey': API_KEY,
-        'secret': API_SECRET,
-        'enableRateLimit': True,
-        'options': {
-            'defaultType': 'spot',  # spot trading
-        }
-    })
+    print(f"✓ Exchange loaded: {exchange.name}")
+    print(f"✓ Markets loaded: {len(exchange.markets)} pairs")
+    print(f"✓ Time: {exchange.iso8601(exchange.milliseconds())}")
 
-    try:
-        await exchange.load_markets()
-        print(f"✓ Exchange loaded: {exchange.name}")
-        print(f"✓ Markets loaded: {len(exchange.markets)} pairs")
-        print(f"✓ Time: {exchange.iso8601(exchange.milliseconds())}")
-
-        # Show some popular pairs
-        popular = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT']
-        print("\nPopular pairs available:")
-        for symbol in popular:
-            if symbol in exchange.markets:
-                market = exchange.markets[symbol]
-                print(f"  - {symbol}: min_amount={market['limits']['amount']['min']}, "
-                      f"precision={market['precision']['price']}")
-
-        return exchange
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return None
+    # Show some popular pairs
+    popular = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'BNB/USDT']
+    print("\nPopular pairs available:")
+    for symbol in popular:
+        if symbol in exchange.markets:
+            market = MarketView.from_market(exchange.markets[symbol])
+            print(f"  - {symbol}: min_amount={market.min_amount}, "
+                  f"precision={market.price_precision}")
 
 
 async def test_fetch_ohlcv(exchange):
-    """Test fetching OHLCV (klines) data - critical for backfill."""
-    print("\n" + "=" * 60)
-    print("2. FETCH OHLCV (KLINES) - BACKFILL DATA")
-    print("=" * 60)
+    """Test fetching OHLCV (klines) data - critical for backfill. Returns the report text."""
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("2. FETCH OHLCV (KLINES) - BACKFILL DATA")
+    lines.append("=" * 60)
 
     symbol = 'BTC/USDT'
     timeframe = '1m'  # 1 minute candles
@@ -71,98 +56,95 @@ async def test_fetch_ohlcv(exchange):
     try:
         # Fetch recent candles
         ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-        print(f"✓ Fetched {len(ohlcv)} candles for {symbol}")
-        print("\nFormat: [timestamp, open, high, low, close, volume]")
-        print("\nLast 5 candles:")
+        lines.append(f"✓ Fetched {len(ohlcv)} candles for {symbol}")
+        lines.append("\nFormat: [timestamp, open, high, low, close, volume]")
+        lines.append("\nLast 5 candles:")
         for candle in ohlcv[-5:]:
-            ts = datetime.fromtimestamp(candle[0] / 1000, tz=UTC)
-            print(f"  {ts.isoformat()} | O: {candle[1]:.2f} | H: {candle[2]:.2f} | "
-                  f"L: {candle[3]:.2f} | C: {candle[4]:.2f} | V: {candle[5]:.4f}")
+            lines.append(f"  {fmt_ts(candle[0])} | O: {candle[1]:.2f} | H: {candle[2]:.2f} | "
+                         f"L: {candle[3]:.2f} | C: {candle[4]:.2f} | V: {candle[5]:.4f}")
 
         # Test since parameter (for backfill from specific time)
-        print("\n--- Backfill simulation (last 5 minutes) ---")
+        lines.append("\n--- Backfill simulation (last 5 minutes) ---")
         now = exchange.milliseconds()
         five_min_ago = now - (5 * 60 * 1000)  # 5 minutes in ms
 
         ohlcv_backfill = await exchange.fetch_ohlcv(symbol, timeframe, since=five_min_ago)
-        print(f"✓ Backfill fetch: {len(ohlcv_backfill)} candles since 5 min ago")
+        lines.append(f"✓ Backfill fetch: {len(ohlcv_backfill)} candles since 5 min ago")
 
         # Demonstrate the candle timestamp alignment
         if ohlcv_backfill:
             first_candle_ts = ohlcv_backfill[0][0]
-            first_candle_dt = datetime.fromtimestamp(first_candle_ts / 1000, tz=UTC)
-            print(f"  First candle timestamp: {first_candle_dt.isoformat()}")
-            print("  Candle interval: 1 minute")
-
-        return ohlcv
+            lines.append(f"  First candle timestamp: {fmt_ts(first_candle_ts)}")
+            lines.append("  Candle interval: 1 minute")
     except Exception as e:
-        print(f"✗ Error fetching OHLCV: {e}")
-        return None
+        lines.append(f"✗ Error fetching OHLCV: {e}")
+
+    return "\n".join(lines)
 
 
 async def test_fetch_ticker(exchange):
-    """Test fetching current price/ticker."""
-    print("\n" + "=" * 60)
-    print("3. FETCH CURRENT PRICE (TICKER)")
-    print("=" * 60)
+    """Test fetching current price/ticker. Returns the report text."""
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("3. FETCH CURRENT PRICE (TICKER)")
+    lines.append("=" * 60)
 
     symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT']
 
     try:
-        # Single ticker
-        ticker = await exchange.fetch_ticker('BTC/USDT')
-        print("✓ BTC/USDT ticker:")
-        print(f"  Last: {ticker['last']}")
-        print(f"  Bid: {ticker['bid']}, Ask: {ticker['ask']}")
-        print(f"  24h Volume: {ticker['quoteVolume']}")
-        print(f"  Timestamp: {exchange.iso8601(ticker['timestamp'])}")
-
-        # Multiple tickers (more efficient)
-        print("\n✓ Multiple tickers:")
+        # One batched request covers all symbols (single round-trip).
+        # Binance's lighter MINI ticker type omits bid/ask, so request the full one.
         tickers = await exchange.fetch_tickers(symbols)
+        ticker = tickers['BTC/USDT']
+        lines.append("✓ BTC/USDT ticker:")
+        lines.append(f"  Last: {ticker['last']}")
+        lines.append(f"  Bid: {ticker['bid']}, Ask: {ticker['ask']}")
+        lines.append(f"  24h Volume: {ticker['quoteVolume']}")
+        lines.append(f"  Timestamp: {exchange.iso8601(ticker['timestamp'])}")
+
+        lines.append("\n✓ Multiple tickers:")
         for symbol in symbols:
             if symbol in tickers:
-                print(f"  {symbol}: {tickers[symbol]['last']}")
-
-        return tickers
+                lines.append(f"  {symbol}: {tickers[symbol]['last']}")
     except Exception as e:
-        print(f"✗ Error fetching tickers: {e}")
-        return None
+        lines.append(f"✗ Error fetching tickers: {e}")
+
+    return "\n".join(lines)
 
 
 async def test_wallet_balance(exchange):
-    """Test fetching wallet/balance information."""
-    print("\n" + "=" * 60)
-    print("4. WALLET & BALANCE INSPECTION")
-    print("=" * 60)
+    """Test fetching wallet/balance information. Returns the report text."""
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("4. WALLET & BALANCE INSPECTION")
+    lines.append("=" * 60)
 
     try:
         balance = await exchange.fetch_balance()
-        print("✓ Balance fetched")
-        print("\nNon-zero balances:")
-
-        total_value = 0
-        for currency, amounts in balance['total'].items():
-            if amounts and amounts > 0:
-                free = balance['free'].get(currency, 0)
-                used = balance['used'].get(currency, 0)
-                print(f"  {currency}: total={amounts:.6f}, free={free:.6f}, used={used:.6f}")
-
-                # Rough USD estimate for major coins
-                if currency == 'USDT':
-                    total_value += amounts
-                elif currency == 'BTC':
-                    total_value += amounts * 100000  # rough price
-                elif currency == 'ETH':
-                    total_value += amounts * 3000
-
-        print(f"\n  Info timestamp: {balance.get('timestamp')}")
-
-        return balance
+        lines.append("✓ Balance fetched")
+        lines.append("\nNon-zero balances:")
+
+        held = {c: amt for c, amt in balance['total'].items() if amt and amt > 0}
+        for currency, amounts in held.items():
+            free = balance['free'].get(currency, 0)
+            used = balance['used'].get(currency, 0)
+            lines.append(f"  {currency}: total={amounts:.6f}, free={free:.6f}, used={used:.6f}")
+
+        # USD estimate: one price lookup per held asset from live USDT tickers
+        prices = {c: 1.0 for c in ['USDT', 'USDC', 'BUSD']}
+        pairs = [f"{c}/USDT" for c in held if f"{c}/USDT" in exchange.markets]
+        if pairs:
+            tickers = await exchange.fetch_tickers(pairs)
+            prices.update({sym.split('/')[0]: t['last'] for sym, t in tickers.items() if t['last']})
+        total_value = sum(amt * prices.get(cur, 0.0) for cur, amt in held.items())
+
+        lines.append(f"\n  Estimated total value: ${total_value:,.2f}")
+        lines.append(f"  Info timestamp: {balance.get('timestamp')}")
     except Exception as e:
-        print(f"✗ Error fetching balance: {e}")
-        print("  (This is expected if using testnet or no balance)")
-        return None
+        lines.append(f"✗ Error fetching balance: {e}")
+        lines.append("  (This is expected if using testnet or no balance)")
+
+    return "\n".join(lines)
 
 
 async def test_rate_limits(exchange):
@@ -174,87 +156,86 @@ async def test_rate_limits(exchange):
     print("Exchange rate limit settings:")
     print(f"  enableRateLimit: {exchange.enableRateLimit}")
     print(f"  rateLimit: {exchange.rateLimit} ms between requests")
+    print(f"  tokenBucket: capacity={exchange.throttler.config['capacity']}, "
+          f"refillRate={exchange.throttler.config['refillRate']}/ms")
 
     # Make multiple rapid requests to test rate limiting
     print("\nMaking 5 rapid OHLCV requests to test rate limiting...")
     symbol = 'BTC/USDT'
     start_time = exchange.milliseconds()
 
-    for i in range(5):
+    async def probe(i):
         try:
-            ohlcv = await exchange.fetch_ohlcv(symbol, '1m', limit=1)
+            await exchange.fetch_ohlcv(symbol, '1m', limit=1)
             elapsed = exchange.milliseconds() - start_time
             print(f"  Request {i+1}: OK (elapsed: {elapsed}ms)")
         except Exception as e:
             print(f"  Request {i+1}: Error - {e}")
 
+    # Fire all probes at once and let CCXT's throttler pace them
+    await asyncio.gather(*(probe(i) for i in range(5)))
+
     total_elapsed = exchange.milliseconds() - start_time
     print(f"\nTotal time for 5 requests: {total_elapsed}ms")
     print(f"Average per request: {total_elapsed / 5:.0f}ms")
+    if total_elapsed:
+        print(f"Measured throughput: {5000 / total_elapsed:.1f} req/s")
 
 
 async def test_backfill_design(exchange):
-    """Simulate the backfill operation design."""
-    print("\n" + "=" * 60)
-    print("6. BACKFILL DESIGN SIMULATION")
-    print("=" * 60)
+    """Simulate the backfill operation design. Returns the report text."""
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("6. BACKFILL DESIGN SIMULATION")
+    lines.append("=" * 60)
 
     symbol = 'BTC/USDT'
     backfill_minutes = 5
 
-    print(f"Scenario: New symbol '{symbol}' registered")
-    print(f"Backfill requirement: {backfill_minutes} minutes of historical data")
+    lines.append(f"Scenario: New symbol '{symbol}' registered")
+    lines.append(f"Backfill requirement: {backfill_minutes} minutes of historical data")
 
     # Simulate registration time
     now = exchange.milliseconds()
-    now_dt = datetime.fromtimestamp(now / 1000, tz=UTC)
-    print(f"\nCurrent time: {now_dt.isoformat()}")
+    lines.append(f"\nCurrent time: {fmt_ts(now)}")
 
     # Calculate backfill window
     # We want candles for: [now-5min, now-4min, now-3min, now-2min, now-1min]
     # Plus current minute (which may not be closed yet)
     backfill_start = now - (backfill_minutes * 60 * 1000)
-    backfill_start_dt = datetime.fromtimestamp(backfill_start / 1000, tz=UTC)
-
-    print(f"Backfill window: {backfill_start_dt.isoformat()} to {now_dt.isoformat()}")
+    lines.append(f"Backfill window: {fmt_ts(backfill_start)} to {fmt_ts(now)}")
 
     # Fetch the backfill data
-    print(f"\nFetching {backfill_minutes} minutes of 1m candles...")
-    ohlcv = await exchange.fetch_ohlcv(symbol, '1m', since=backfill_start, limit=backfill_minutes + 1)
+    lines.append(f"\nFetching {backfill_minutes} minutes of 1m candles...")
+    # Pages are fetched concurrently; longer windows just mean more pages
+    ohlcv = await fetch_ohlcv_range(exchange, symbol, backfill_start, now + 60 * 1000)
 
-    print(f"✓ Received {len(ohlcv)} candles")
+    lines.append(f"✓ Received {len(ohlcv)} candles")
 
     # Analyze what we got
     if ohlcv:
-        print("\nCandle timestamps (UTC):")
+        lines.append("\nCandle timestamps (UTC):")
         for candle in ohlcv:
-            ts = candle[0]
-            dt = datetime.fromtimestamp(ts / 1000, tz=UTC)
-            close = candle[4]
-            print(f"  {dt.strftime('%H:%M:%S')} | close: {close:.2f}")
+            lines.append(f"  {fmt_ts(candle[0], '%H:%M:%S')} | close: {candle[4]:.2f}")
 
         # Check for gaps
         if len(ohlcv) >= 2:
             expected_interval = 60 * 1000  # 1 minute in ms
-            gaps = []
-            for i in range(1, len(ohlcv)):
-                diff = ohlcv[i][0] - ohlcv[i-1][0]
-                if diff != expected_interval:
-                    gaps.append((i, diff))
+            diffs = (b[0] - a[0] for a, b in pairwise(ohlcv))
+            gaps = [(i, diff) for i, diff in enumerate(diffs, start=1) if diff != expected_interval]
 
             if gaps:
-                print("\n⚠ Gaps detected in data:")
+                lines.append("\n⚠ Gaps detected in data:")
                 for idx, diff in gaps:
-                    print(f"  Between candle {idx-1} and {idx}: {diff/1000:.0f}s gap")
+                    lines.append(f"  Between candle {idx-1} and {idx}: {diff/1000:.0f}s gap")
             else:
-                print("\n✓ No gaps detected in data")
+                lines.append("\n✓ No gaps detected in data")
 
     # Next heartbeat fetch timing
     next_minute = ((now // 60000) + 1) * 60000
-    next_minute_dt = datetime.fromtimestamp(next_minute / 1000, tz=UTC)
-    print(f"\nNext heartbeat should fetch from: {next_minute_dt.isoformat()}")
+    lines.append(f"\nNext heartbeat should fetch from: {fmt_ts(next_minute)}")
 
-    return ohlcv
+    return "\n".join(lines)
 
 
 async def test_order_placement(exchange):
@@ -300,25 +281,35 @@ async def main():
         print("\n✗ ERROR: API keys not found in environment!")
         return
 
-    exchange = await test_exchange_setup()
-    if not exchange:
-        return
-
     try:
-        await test_fetch_ohlcv(exchange)
-        await test_fetch_ticker(exchange)
-        await test_wallet_balance(exchange)
-        await test_rate_limits(exchange)
-        await test_backfill_design(exchange)
-        await test_order_placement(exchange)
-
-        print("\n" + "=" * 60)
-        print("RESEARCH COMPLETE")
-        print("=" * 60)
+        async with binance_client() as exchange:
+            await test_exchange_setup(exchange)
+
+            # Independent read-only experiments run concurrently; each returns
+            # its report so the sections print in order instead of interleaving
+            reports = await asyncio.gather(
+                test_fetch_ohlcv(exchange),
+                test_fetch_ticker(exchange),
+                test_wallet_balance(exchange),
+                test_backfill_design(exchange),
+            )
+            for report in reports:
+                print(report)
+            await test_rate_limits(exchange)
+            await test_order_placement(exchange)
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        return
 
-    finally:
-        await exchange.close()
+    print("\n" + "=" * 60)
+    print("RESEARCH COMPLETE")
+    print("=" * 60)
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # optional: faster event loop on Linux/macOS
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
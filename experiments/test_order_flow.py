@@ -6,15 +6,8 @@ It validates order structures, checks minimums, and simulates the order lifecycl
 """
 
 import asyncio
-import os
 
-import ccxt.async_support as ccxt
-from dotenv import load_dotenv
-
-load_dotenv()
-
-API_KEY = os.getenv("BINANCE_API_KEY")
-API_SECRET = os.getenv("BINANCE_API_SECRET")
+from _exchange import API_KEY, API_SECRET, MarketView, binance_client
 
 
 async def analyze_order_structure():
@@ -23,25 +16,17 @@ async def analyze_order_structure():
     print("ORDER FLOW ANALYSIS")
     print("=" * 60)
 
-    exchange = ccxt.binance({
-        'apiKey': API_KEY,
-        'secret': API_SECRET,
-        'enableRateLimit': True,
-    })
-
-    try:
-        await exchange.load_markets()
-
+    async with binance_client() as exchange:
         # Analyze BTC/USDT market
         symbol = 'BTC/USDT'
-        market = exchange.markets[symbol]
+        market = MarketView.from_market(exchange.markets[symbol])
 
         print(f"\nMarket: {symbol}")
-        print(f"  Min order amount: {market['limits']['amount']['min']} BTC")
-        print(f"  Max order amount: {market['limits']['amount']['max']} BTC")
-        print(f"  Min cost: {market['limits']['cost']['min']} USDT")
-        print(f"  Price precision: {market['precision']['price']} decimals")
-        print(f"  Amount precision: {market['precision']['amount']} decimals")
+        print(f"  Min order amount: {market.min_amount} BTC")
+        print(f"  Max order amount: {market.max_amount} BTC")
+        print(f"  Min cost: {market.min_cost} USDT")
+        print(f"  Price precision: {market.price_precision} decimals")
+        print(f"  Amount precision: {market.amount_precision} decimals")
 
         # Check our balance
         balance = await exchange.fetch_balance()
@@ -55,13 +40,13 @@ async def analyze_order_structure():
         # Calculate min order in USDC terms
         ticker = await exchange.fetch_ticker(symbol)
         current_price = ticker['last']
-        min_btc = market['limits']['amount']['min']
+        min_btc = market.min_amount
         min_cost_usd = min_btc * current_price
 
         print(f"\nOrder minimums at price {current_price}:")
         print(f"  Min BTC amount: {min_btc}")
         print(f"  Equivalent USD: ~{min_cost_usd:.2f}")
-        print(f"  Min order cost: {market['limits']['cost']['min']} USDT")
+        print(f"  Min order cost: {market.min_cost} USDT")
 
         # Check if we can place a minimum order
         print("\nCan we place a minimum order?")
@@ -129,9 +114,6 @@ Expected response structure:
             'can_trade': usdc_balance >= min_cost_usd
         }
 
-    finally:
-        await exchange.close()
-
 
 async def simulate_order_lifecycle():
     """Simulate the full order lifecycle for documentation."""
@@ -216,4 +198,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # optional: faster event loop on Linux/macOS
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
@@ -0,0 +1,76 @@
+"""
+Shared async HTTP client for the end-to-end scripts.
+
+Both scripts talk to the running API through one pooled aiohttp session so
+keep-alive connections are reused for the whole run.
+"""
+
+import asyncio
+from urllib.parse import quote
+
+import aiohttp
+
+BASE_URL = "http://localhost:8000"
+
+
+def create_session():
+    """Create one pooled session shared by all requests (keep-alive reuse)."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=32, keepalive_timeout=30, use_dns_cache=True, ttl_dns_cache=300
+        )
+    )
+
+
+async def gather_bounded(coros, concurrency=50):
+    """Like asyncio.gather, but with at most ``concurrency`` awaitables in flight."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=True)
+
+
+class TradingClient:
+    """Minimal client for the trading system REST API."""
+
+    def __init__(self, session, base_url=BASE_URL):
+        self._session = session
+        self._base_url = base_url
+        self._symbol_urls = {}
+
+    def _symbol_url(self, symbol):
+        """URL for a single symbol, encoded once and reused across polls."""
+        url = self._symbol_urls.get(symbol)
+        if url is None:
+            url = f"{self._base_url}/symbols/{quote(symbol, safe='')}"
+            self._symbol_urls[symbol] = url
+        return url
+
+    async def health(self, timeout=5):
+        """Return the health payload, or None if the API is not healthy."""
+        async with self._session.get(
+            f"{self._base_url}/health", timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as resp:
+            if resp.status != 200:
+                return None
+            return await resp.json()
+
+    async def register(self, symbol):
+        """Register a symbol. Returns ``(status_code, payload)``."""
+        async with self._session.post(
+            f"{self._base_url}/symbols", json={"symbol": symbol}
+        ) as resp:
+            return resp.status, await resp.json()
+
+    async def list_symbols(self):
+        """Return the ``/symbols`` listing payload."""
+        async with self._session.get(f"{self._base_url}/symbols") as resp:
+            return await resp.json()
+
+    async def get_symbol(self, symbol):
+        """Return the payload for a single symbol."""
+        async with self._session.get(self._symbol_url(symbol)) as resp:
+            return await resp.json()
@@ -15,73 +15,84 @@ Usage:
 """
 
 import asyncio
-import subprocess
+import sqlite3
 import sys
-import time
 from pathlib import Path
 
 import aiohttp
+from _client import TradingClient, create_session, gather_bounded
 
-BASE_URL = "http://localhost:8000"
 DB_PATH = Path("data/trading.db")
-
-
-async def check_health(max_retries=30):
-    """Check if API is healthy, with retries."""
-    for i in range(max_retries):
+SYSTEM_LOG_PATH = Path("logs/test_full_cycle_system.log")
+
+
+async def poll_until(predicate, timeout=120, interval=5):
+    """Await ``predicate()`` every ``interval`` seconds until it is true or time runs out."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if await predicate():
+            return True
+        await asyncio.sleep(min(interval, max(0, deadline - loop.time())))
+    return await predicate()
+
+
+async def check_health(client, timeout=30):
+    """Check if API is healthy, retrying with exponential backoff."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = 0.05
+    while loop.time() < deadline:
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{BASE_URL}/health", timeout=2) as resp:
-                    if resp.status == 200:
-                        return True
-        except:
-            pass
-        await asyncio.sleep(1)
+            if await client.health(timeout=1) is not None:
+                return True
+        except (aiohttp.ClientError, TimeoutError):
+            pass  # not accepting connections yet
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 2.0)
     return False
 
 
-async def register_symbol(symbol: str):
+async def register_symbol(client, symbol: str):
     """Register a symbol."""
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{BASE_URL}/symbols",
-            json={"symbol": symbol}
-        ) as resp:
-            data = await resp.json()
-            if resp.status == 201:
-                backfilled = data['backfill_status'].get('total_records', 0)
-                print(f"✅ Registered {symbol} (backfilled: {backfilled} records)")
-                return True
-            else:
-                print(f"❌ Failed to register {symbol}: {data}")
-                return False
+    status, data = await client.register(symbol)
+    if status == 201:
+        backfilled = data['backfill_status'].get('total_records', 0)
+        print(f"✅ Registered {symbol} (backfilled: {backfilled} records)")
+        return True
+    else:
+        print(f"❌ Failed to register {symbol}: {data}")
+        return False
 
 
-async def count_db_records():
-    """Count records in the database."""
-    from trading_system.database import DatabaseManager
-    
-    if not DB_PATH.exists():
-        return 0, 0
-    
-    db = DatabaseManager(str(DB_PATH))
-    await db.initialize()
-    
+async def register_all(client, symbols):
+    """Register all symbols concurrently; one failure doesn't abort the rest."""
+    results = await gather_bounded(register_symbol(client, s) for s in symbols)
+    for sym, result in zip(symbols, results):
+        if isinstance(result, Exception):
+            print(f"❌ Failed to register {sym}: {result}")
+    return all(result is True for result in results)
+
+
+async def count_db_records(db):
+    """Count price records and active symbols in a single query."""
     try:
-        row = await db.fetch_one("SELECT COUNT(*) as count FROM price_data")
-        symbol_row = await db.fetch_one("SELECT COUNT(*) as count FROM symbols WHERE is_active = 1")
-        count = row["count"] if row else 0
-        symbols = symbol_row["count"] if symbol_row else 0
-    except:
-        count = 0
-        symbols = 0
-    finally:
-        await db.close()
+        row = await db.fetch_one(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM price_data) AS pcount,
+                (SELECT COUNT(*) FROM symbols WHERE is_active = 1) AS scount
+            """
+        )
+    except sqlite3.Error:
+        return 0, 0
     
-    return count, symbols
+    if row is None:
+        return 0, 0
+    return row["pcount"], row["scount"]
 
 
-def main():
+async def main():
     print("=" * 60)
     print("Trading System - Full Cycle Test")
     print("=" * 60)
@@ -95,72 +106,96 @@ def main():
         print("🗑️  Removing old database...")
         DB_PATH.unlink()
     
-    # Start the system
+    # Start the system. Its output goes straight to a log file: an unread
+    # pipe would fill up and block the server's writes mid-run.
     print("🚀 Starting trading system...")
-    proc = subprocess.Popen(
-        [sys.executable, "-m", "trading_system.main"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-    
-    # Wait for system to be ready
-    print("⏳ Waiting for system to be ready...")
-    asyncio.run(asyncio.sleep(3))
-    
-    if not asyncio.run(check_health()):
-        print("❌ System failed to start")
-        proc.terminate()
-        return 1
-    
-    print("✅ System is running")
-    print()
-    
-    # Register symbols
-    print("📝 Registering symbols...")
-    symbols = ["BTC/USDT", "ETH/USDT"]
-    for sym in symbols:
-        if not asyncio.run(register_symbol(sym)):
+    print(f"   (server output: {SYSTEM_LOG_PATH})")
+    SYSTEM_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(SYSTEM_LOG_PATH, "wb") as system_log:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "trading_system.main",
+            stdout=system_log,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    
+    async with create_session() as session:
+        client = TradingClient(session)
+        
+        # Wait for system to be ready
+        print("⏳ Waiting for system to be ready...")
+        if not await check_health(client):
+            print("❌ System failed to start")
+            proc.terminate()
+            return 1
+        
+        print("✅ System is running")
+        print()
+        
+        # Register symbols
+        print("📝 Registering symbols...")
+        symbols = ["BTC/USDT", "ETH/USDT"]
+        if not await register_all(client, symbols):
             proc.terminate()
             return 1
     
-    # Count backfilled records
-    count, _ = asyncio.run(count_db_records())
-    print(f"📊 Records after backfill: {count}")
-    print()
+    from trading_system.database import DatabaseManager
     
-    # Wait 2 minutes for price fetching
-    print("⏳ Waiting 2 minutes for heartbeat price fetching...")
-    print("   (The heartbeat runs every 65 seconds)")
-    for remaining in range(120, 0, -10):
-        print(f"   {remaining}s remaining...", end="\r")
-        time.sleep(10)
-    print("   Done!                    ")
-    print()
+    # Expected calculation
+    expected_backfill = 10  # 5 per symbol × 2 symbols
+    expected_live = 4       # ~2 per symbol × 2 symbols
+    expected_total = expected_backfill + expected_live
     
-    # Stop the system
-    print("🛑 Stopping system...")
-    proc.terminate()
+    # One connection serves every count for the rest of the run
+    db = DatabaseManager(DB_PATH)
+    await db.initialize()
     try:
-        proc.wait(timeout=10)
-        print("✅ System stopped gracefully")
-    except subprocess.TimeoutExpired:
-        proc.kill()
-        print("⚠️  System killed (didn't stop gracefully)")
-    print()
-    
-    # Verify database
-    print("🔍 Verifying database...")
-    count, symbol_count = asyncio.run(count_db_records())
+        # Count backfilled records
+        count, _ = await count_db_records(db)
+        print(f"📊 Records after backfill: {count}")
+        print()
+        
+        last_count = count
+        
+        async def enough_records():
+            nonlocal last_count
+            if proc.returncode is not None:
+                print(f"   ❌ System exited early (code {proc.returncode})")
+                return True
+            current, _ = await count_db_records(db)
+            if current != last_count:
+                print(f"   📊 {current} records (+{current - last_count})")
+                last_count = current
+            return current >= expected_total
+        
+        # Wait up to 2 minutes for price fetching, stopping early once done
+        print("⏳ Waiting up to 2 minutes for heartbeat price fetching...")
+        print("   (The heartbeat runs every 65 seconds)")
+        await poll_until(enough_records, timeout=120, interval=5)
+        print("   Done!")
+        print()
+        
+        # Stop the system
+        print("🛑 Stopping system...")
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=10)
+            print("✅ System stopped gracefully")
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            print("⚠️  System killed (didn't stop gracefully)")
+        print()
+        
+        # Verify database
+        print("🔍 Verifying database...")
+        count, symbol_count = await count_db_records(db)
+    finally:
+        await db.close()
     
     print(f"   Active symbols: {symbol_count}")
     print(f"   Price records: {count}")
     print()
     
-    # Expected calculation
-    expected_backfill = 10  # 5 per symbol × 2 symbols
-    expected_live = 4       # ~2 per symbol × 2 symbols
-    expected_total = expected_backfill + expected_live
-    
     print(f"   Expected: ~{expected_total} records")
     print(f"   - Backfill: ~{expected_backfill} (5 per symbol)")
     print(f"   - Live fetch: ~{expected_live} (2 per symbol, 2 minutes)")
@@ -179,4 +214,8 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        from uvloop import run  # optional: faster event loop on Linux/macOS
+    except ImportError:
+        from asyncio import run
+    sys.exit(run(main()))
@@ -3,69 +3,55 @@
 
 import argparse
 import asyncio
+import sys
 import time
 
-import aiohttp
+from _client import BASE_URL, TradingClient, create_session, gather_bounded
 
-BASE_URL = "http://localhost:8000"
+
+async def check_health(client):
+    try:
+        data = await client.health()
+        if data is not None:
+            print(f"✅ API healthy: {data}")
+            return True
+    except Exception as e:
+        print(f"❌ Cannot connect: {e}")
+    return False
 
 
-async def check_health():
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(f"{BASE_URL}/health", timeout=5) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    print(f"✅ API healthy: {data}")
-                    return True
-        except Exception as e:
-            print(f"❌ Cannot connect: {e}")
+async def register_symbol(client, symbol: str):
+    status, data = await client.register(symbol)
+    if status == 201:
+        print(f"✅ Registered {symbol}")
+        return True
+    elif status == 400:
+        print(f"ℹ️  {symbol} already registered")
+        return True
+    else:
+        print(f"❌ Failed: {data}")
         return False
 
 
-async def register_symbol(symbol: str):
-    async with aiohttp.ClientSession() as session:
-        async with session.post(f"{BASE_URL}/symbols", json={"symbol": symbol}) as resp:
-            data = await resp.json()
-            if resp.status == 201:
-                print(f"✅ Registered {symbol}")
-                return True
-            elif resp.status == 400:
-                print(f"ℹ️  {symbol} already registered")
-                return True
-            else:
-                print(f"❌ Failed: {data}")
-                return False
-
-
-async def list_symbols():
-    async with aiohttp.ClientSession() as session:
-        async with session.get(f"{BASE_URL}/symbols") as resp:
-            data = await resp.json()
-            print(f"📊 {data['count']} symbols:")
-            for s in data['symbols']:
-                price = s.get('last_price')
-                price_str = f"${price:,.2f}" if price else "N/A"
-                print(f"   - {s['symbol']}: {price_str}")
-            return data['symbols']
-
-
-async def wait_for_prices(symbols, timeout=120):
+async def list_symbols(client):
+    data = await client.list_symbols()
+    print(f"📊 {data['count']} symbols:")
+    for s in data['symbols']:
+        price = s.get('last_price')
+        price_str = f"${price:,.2f}" if price else "N/A"
+        print(f"   - {s['symbol']}: {price_str}")
+    return data['symbols']
+
+
+async def wait_for_prices(client, symbols, timeout=120):
     print(f"\n⏳ Waiting for prices (timeout: {timeout}s)...")
     start = time.time()
     while time.time() - start < timeout:
-        async with aiohttp.ClientSession() as session:
-            all_have = True
-            for sym in symbols:
-                enc = sym.replace("/", "%2F")
-                async with session.get(f"{BASE_URL}/symbols/{enc}") as r:
-                    d = await r.json()
-                    if d.get('last_price') is None:
-                        all_have = False
-                        break
-            if all_have:
-                print(f"✅ Got prices in {time.time()-start:.1f}s")
-                return True
+        # Look up all symbols concurrently so a poll cycle costs one RTT
+        results = await asyncio.gather(*(client.get_symbol(s) for s in symbols))
+        if all(d.get('last_price') is not None for d in results):
+            print(f"✅ Got prices in {time.time()-start:.1f}s")
+            return True
         await asyncio.sleep(10)
     return False
 
@@ -81,26 +67,45 @@ async def main():
     print("Trading System E2E Test")
     print("=" * 50)
 
-    if not await check_health():
-        print("\nStart the server first: python trading_system/main.py")
-        return 1
-
-    print("\n2️⃣ Registering symbols...")
-    for s in args.symbols:
-        await register_symbol(s)
-
-    print("\n3️⃣ Listing symbols...")
-    symbols = await list_symbols()
-
-    if args.wait:
-        print("\n4️⃣ Waiting for prices...")
-        await wait_for_prices([s['symbol'] for s in symbols], args.timeout)
-        print("\n5️⃣ Updated list:")
-        await list_symbols()
+    session = create_session()
+    client = TradingClient(session)
+    try:
+        if not await check_health(client):
+            print("\nStart the server first: python trading_system/main.py")
+            return 1
+
+        print("\n2️⃣ Registering symbols...")
+        results = await gather_bounded(register_symbol(client, s) for s in args.symbols)
+        # register_symbol returns False for a rejected request (already
+        # reported) and gather_bounded returns exceptions in place of results
+        failed = False
+        for sym, result in zip(args.symbols, results):
+            if isinstance(result, BaseException):
+                print(f"❌ Failed to register {sym}: {result}")
+                failed = True
+            elif result is False:
+                failed = True
+        if failed:
+            return 1
+
+        print("\n3️⃣ Listing symbols...")
+        symbols = await list_symbols(client)
+
+        if args.wait:
+            print("\n4️⃣ Waiting for prices...")
+            await wait_for_prices(client, [s['symbol'] for s in symbols], args.timeout)
+            print("\n5️⃣ Updated list:")
+            await list_symbols(client)
+    finally:
+        await session.close()
 
     print(f"\n📈 Chart: {BASE_URL}/plot/prices")
     return 0
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        from uvloop import run  # optional: faster event loop on Linux/macOS
+    except ImportError:
+        from asyncio import run
+    sys.exit(run(main()))
@@ -0,0 +1,163 @@
+"""Shared fixtures for the test suite."""
+
+import asyncio
+import shutil
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from trading_system.api import app
+from trading_system.config import Settings
+from trading_system.database import DatabaseManager
+
+try:
+    import uvloop  # optional: faster event loop on Linux/macOS
+except ImportError:
+    uvloop = None
+
+# Child tables (price_data, strategies, trades, ...) are removed through
+# ON DELETE CASCADE when their parent rows go
+_RESET_TABLES = ("symbols", "wallet_snapshots", "sqlite_sequence")
+
+_TEST_PRAGMAS = (
+    "synchronous = OFF",
+    "journal_mode = MEMORY",
+    "temp_store = MEMORY",
+    "locking_mode = EXCLUSIVE",
+    "busy_timeout = 0",
+)
+
+
+async def _apply_test_pragmas(db):
+    """Drop durability and locking overhead on a test database.
+
+    Tests own the only connection and never need crash safety, so skip
+    syncing and locking (test-only; production keeps WAL).
+    """
+    for pragma in _TEST_PRAGMAS:
+        await db.execute(f"PRAGMA {pragma}")
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests and fixtures on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def env_settings():
+    """Load settings (environment and .env) once for the whole session."""
+    return Settings()
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """One TestClient for the API, shared by the whole session.
+
+    Not entered as a context manager: tests override the app's dependencies,
+    so the lifespan (database file and Binance client) is never needed.
+    """
+    return TestClient(app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_async_client():
+    """One async client for the API, shared by the whole session.
+
+    Requests run in-process on the session event loop, with no portal
+    thread per request as with TestClient. The lifespan (database file and
+    Binance client) never runs; tests override the app's dependencies.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def override_api():
+    """Override the app's dependencies for one test.
+
+    Yields a function taking ``{dependency: value}``; each dependency then
+    resolves to its value. All overrides are cleared after the test.
+    """
+    def override(values):
+        for dependency, value in values.items():
+            app.dependency_overrides[dependency] = _returning(value)
+
+    try:
+        yield override
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _returning(value):
+    """Build an async dependency that returns ``value``, like the app's getters."""
+    async def dependency():
+        return value
+
+    return dependency
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def schema_template(tmp_path_factory):
+    """Build the schema once into a template database file; returns its path."""
+    path = tmp_path_factory.mktemp("template") / "schema.db"
+    db = DatabaseManager(path)
+    await db.initialize()
+    # Closing checkpoints the WAL, so the single file holds the whole schema
+    await db.close()
+    return path
+
+
+@pytest_asyncio.fixture
+async def file_db(tmp_path_factory, schema_template):
+    """Open a private copy of the template database for one test.
+
+    initialize() still runs to open the connection and set pragmas; the
+    idempotent schema script finds every table already there. Copies live
+    under the session's base temp directory, which pytest prunes between
+    runs rather than after every test.
+    """
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    shutil.copyfile(schema_template, db_path)
+    db = DatabaseManager(db_path)
+    await db.initialize()
+    # Commits would otherwise hit the disk; the file is thrown away anyway
+    await _apply_test_pragmas(db)
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_db():
+    """Create and initialize one in-memory database for the whole test session.
+
+    Schema creation runs once; tests get it through ``clean_db``, which
+    empties the tables first. Under pytest-xdist each worker process gets
+    its own database. One connection is enough: a worker runs one test at a
+    time, and a pool of shared-cache connections would only add SQLite's
+    table-level locking between them.
+    """
+    db = DatabaseManager(":memory:")
+    await db.initialize()
+    await _apply_test_pragmas(db)
+
+    try:
+        yield db
+    finally:
+        # Shielded so a cancelled teardown cannot leave the connection half closed
+        await asyncio.shield(db.close())
+
+
+@pytest_asyncio.fixture
+async def clean_db(session_db):
+    """Provide the session database with all rows from earlier tests removed."""
+    for table in _RESET_TABLES:
+        await session_db.execute(f"DELETE FROM {table}")
+    return session_db
@@ -0,0 +1,30 @@
+"""Hand-written stand-ins for collaborators used by unit tests.
+
+Cheaper than ``MagicMock(spec=...)``, which introspects the whole class for
+every mock it builds. Fakes record their calls so tests can assert on them;
+tests that need other behaviour replace a method with an ``AsyncMock``.
+"""
+
+from trading_system.clients import OHLCVData
+
+
+class FakeBinanceClient:
+    """BinanceClient stand-in with a fixed clock and canned candles."""
+
+    def __init__(self, milliseconds: int = 1000000000000) -> None:
+        self.milliseconds = milliseconds
+        self.candles: list[OHLCVData] = []
+        # Keyword arguments of each fetch_ohlcv() call, in call order
+        self.fetch_ohlcv_calls: list[dict] = []
+
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = '1m',
+        since: int | None = None,
+        limit: int | None = None
+    ) -> list[OHLCVData]:
+        self.fetch_ohlcv_calls.append(
+            {"symbol": symbol, "timeframe": timeframe, "since": since, "limit": limit}
+        )
+        return list(self.candles)
@@ -6,4 +6,10 @@ confidence in the system's correctness.
 
 Run with: pytest -m integration
 Skip with: pytest -m "not integration"
+Run in parallel: pytest -m integration -n auto --dist=loadscope
+
+Each xdist worker is its own process with its own in-memory database and
+Binance stub, so workers share nothing. Run the live Binance tests
+(pytest -m live) without -n so they don't hit the real API from several
+workers at once.
 """
@@ -0,0 +1,140 @@
+"""Local stand-in for the Binance REST API used by integration tests.
+
+Serves just enough of the spot API for CCXT to load markets, fetch tickers
+and fetch 1m klines for a fixed set of symbols. Every other endpoint CCXT
+touches while loading markets (futures, margin, currencies) gets an empty
+answer. The server runs on its own event loop in a background thread so it
+keeps answering no matter which loop a test runs on.
+"""
+
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+
+# Canned last prices per stub market
+PRICES = {"BTC/USDT": 50000.0, "ETH/USDT": 3000.0}
+
+_MINUTE_MS = 60_000
+
+
+def _market_id(symbol: str) -> str:
+    return symbol.replace("/", "")
+
+
+def _spot_market(symbol: str) -> dict:
+    base, quote = symbol.split("/")
+    return {
+        "symbol": _market_id(symbol),
+        "status": "TRADING",
+        "baseAsset": base,
+        "baseAssetPrecision": 8,
+        "quoteAsset": quote,
+        "quotePrecision": 8,
+        "quoteAssetPrecision": 8,
+        "orderTypes": ["LIMIT", "MARKET"],
+        "isSpotTradingAllowed": True,
+        "isMarginTradingAllowed": False,
+        "permissions": ["SPOT"],
+        "filters": [
+            {
+                "filterType": "PRICE_FILTER",
+                "minPrice": "0.01", "maxPrice": "1000000", "tickSize": "0.01",
+            },
+            {
+                "filterType": "LOT_SIZE",
+                "minQty": "0.00001", "maxQty": "9000", "stepSize": "0.00001",
+            },
+        ],
+    }
+
+
+def _ticker(symbol: str, now_ms: int) -> dict:
+    price = PRICES[symbol]
+    return {
+        "symbol": _market_id(symbol),
+        "lastPrice": str(price),
+        "bidPrice": str(price - 0.01),
+        "askPrice": str(price + 0.01),
+        "openPrice": str(price),
+        "highPrice": str(price),
+        "lowPrice": str(price),
+        "volume": "1.0",
+        "quoteVolume": str(price),
+        "openTime": now_ms - 86_400_000,
+        "closeTime": now_ms,
+    }
+
+
+class BinanceStub:
+    """Threaded aiohttp server answering a subset of the Binance REST API."""
+
+    def __init__(self) -> None:
+        self._by_id = {_market_id(s): s for s in PRICES}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    def start(self) -> str:
+        """Start serving on a free loopback port and return the base URL."""
+        self._thread.start()
+        port = asyncio.run_coroutine_threadsafe(self._serve(), self._loop).result()
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    def stop(self) -> None:
+        """Shut the server down and stop its thread."""
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _serve(self) -> int:
+        app = web.Application()
+        app.router.add_get("/api/v3/exchangeInfo", self._exchange_info)
+        app.router.add_get("/api/v3/time", self._time)
+        app.router.add_get("/api/v3/ticker/24hr", self._tickers)
+        app.router.add_get("/api/v3/klines", self._klines)
+        app.router.add_route("*", "/{tail:.*}", self._empty)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        return site._server.sockets[0].getsockname()[1]
+
+    async def _exchange_info(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "timezone": "UTC",
+            "serverTime": int(time.time() * 1000),
+            "symbols": [_spot_market(s) for s in PRICES],
+        })
+
+    async def _time(self, request: web.Request) -> web.Response:
+        return web.json_response({"serverTime": int(time.time() * 1000)})
+
+    async def _tickers(self, request: web.Request) -> web.Response:
+        now_ms = int(time.time() * 1000)
+        if "symbol" in request.query:
+            return web.json_response(_ticker(self._by_id[request.query["symbol"]], now_ms))
+        return web.json_response([_ticker(s, now_ms) for s in PRICES])
+
+    async def _klines(self, request: web.Request) -> web.Response:
+        price = PRICES[self._by_id[request.query["symbol"]]]
+        now_ms = int(time.time() * 1000)
+        start = int(request.query.get("startTime", now_ms - _MINUTE_MS))
+        start -= start % _MINUTE_MS
+        limit = int(request.query.get("limit", 500))
+        candles = [
+            [ts, str(price), str(price), str(price), str(price), "1.0", ts + _MINUTE_MS - 1]
+            for ts in range(start, min(now_ms, start + limit * _MINUTE_MS), _MINUTE_MS)
+        ]
+        return web.json_response(candles)
+
+    async def _empty(self, request: web.Request) -> web.Response:
+        # Futures/margin market lists and currency configs: nothing to report
+        if request.path.endswith("exchangeInfo"):
+            return web.json_response({"symbols": []})
+        return web.json_response([])
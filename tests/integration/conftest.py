@@ -0,0 +1,55 @@
+"""Shared fixtures for integration tests."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from trading_system.clients import BinanceClient
+
+from .binance_stub import BinanceStub
+
+
+@pytest.fixture(scope="session")
+def integration_settings(env_settings):
+    """Settings for integration tests (loaded once per session)."""
+    return env_settings
+
+
+@pytest.fixture(scope="session")
+def binance_stub():
+    """Serve canned Binance responses on a loopback port; yields the base URL."""
+    stub = BinanceStub()
+    yield stub.start()
+    stub.stop()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def stub_binance_client(integration_settings, binance_stub):
+    """One Binance client, pointed at the stub, shared by the whole session."""
+    settings = integration_settings.model_copy(update={"binance_base_url": binance_stub})
+    client = BinanceClient(settings)
+    await client.initialize()
+
+    # The stub has no rate limits; CCXT's throttler would otherwise carry
+    # request weight over from earlier tests and stall batch ticker calls
+    client._exchange.enableRateLimit = False
+
+    try:
+        yield client
+    finally:
+        await asyncio.shield(client.close())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def live_binance_client(integration_settings):
+    """One client connected to the real Binance API, shared by live tests.
+
+    Only created when a ``live`` test asks for it.
+    """
+    client = BinanceClient(integration_settings)
+    try:
+        await client.initialize()
+        yield client
+    finally:
+        await asyncio.shield(client.close())
@@ -1,65 +1,133 @@
 """Integration tests for HeartbeatCoordinator with real BinanceClient.
 
-These tests validate the coordinator's behavior with actual API calls to Binance,
-providing end-to-end confidence in the heartbeat system.
+These tests validate the coordinator's behavior with a real BinanceClient that
+talks to a local Binance stub server, so they run without network access.
+A small live subset against the actual Binance API is deselected by default;
+run it with ``pytest -m live``.
 """
 
 import asyncio
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import pytest_asyncio
 
-from trading_system.clients import BinanceClient
-from trading_system.config import Settings
-from trading_system.database import DatabaseManager
 from trading_system.heartbeat.coordinator import HeartbeatCoordinator
-from trading_system.repositories import SymbolRepository
+from trading_system.repositories import PriceRepository, SymbolRepository
+
+
+@pytest.fixture
+def binance_client(stub_binance_client):
+    """Binance client used by the coordinator (the shared stub client by default)."""
+    return stub_binance_client
 
 
 @pytest_asyncio.fixture
-async def real_coordinator_setup():
-    """Create test setup with real Binance client and database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create database
-        db_path = Path(tmpdir) / "test.db"
-        db = DatabaseManager(db_path)
-        await db.initialize()
+async def real_coordinator_setup(clean_db, integration_settings, binance_client):
+    """Create test setup with real Binance client and the shared database."""
+    db = clean_db
+    settings = integration_settings
+    client = binance_client
+
+    # Patch log manager to avoid file operations in tests
+    with patch('trading_system.heartbeat.coordinator.log_manager') as mock_log_manager:
+        mock_logger = MagicMock()
+        mock_log_manager.get_heartbeat_logger.return_value = mock_logger
+
+        # Create coordinator with real client
+        coordinator = HeartbeatCoordinator(client, db, settings)
+
+        yield (
+            coordinator, client, db, settings, mock_logger,
+            SymbolRepository(db), PriceRepository(db),
+        )
+
+
+class BeatWatcher:
+    """Counts beats reported through the mocked heartbeat logger.
+
+    Installed as the logger's ``info`` side effect so tests can await beats
+    instead of sleeping for a guessed duration, and assert on plain counters
+    instead of scanning the mock's recorded calls.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.started = 0
+        self.completed = 0
+        self._changed = asyncio.Event()
+
+    def __call__(self, message: str, *args, **kwargs) -> None:
+        self.calls += 1
+        if " started at " in message:
+            self.started += 1
+        elif " complete: " in message:
+            self.completed += 1
+        self._changed.set()
+
+    async def _wait_until(self, condition, timeout: float) -> None:
+        async def wait() -> None:
+            while not condition():
+                self._changed.clear()
+                await self._changed.wait()
+
+        await asyncio.wait_for(wait(), timeout=timeout)
+
+    async def wait_started(self, beats: int = 1, timeout: float = 5.0) -> None:
+        """Wait until ``beats`` beats have started."""
+        await self._wait_until(lambda: self.started >= beats, timeout)
+
+    async def wait_completed(self, beats: int = 1, timeout: float = 5.0) -> None:
+        """Wait until ``beats`` beats have finished fetching."""
+        await self._wait_until(lambda: self.completed >= beats, timeout)
+
+
+@pytest.fixture
+def beat_watcher(real_coordinator_setup):
+    """Track heartbeat beats of the coordinator under test."""
+    mock_logger = real_coordinator_setup[4]
+    watcher = BeatWatcher()
+    mock_logger.info.side_effect = watcher
+    return watcher
+
+
+@pytest.mark.integration
+@pytest.mark.live
+class TestCoordinatorLiveBinance:
+    """Smoke test for the coordinator against the actual Binance API."""
 
-        # Load settings and create real Binance client
-        settings = Settings()
-        client = BinanceClient(settings)
-        await client.initialize()
+    @pytest.fixture
+    def binance_client(self, live_binance_client):
+        """Use the client connected to the real Binance API instead of the stub."""
+        return live_binance_client
 
-        # Patch log manager to avoid file operations in tests
-        with patch('trading_system.heartbeat.coordinator.log_manager') as mock_log_manager:
-            mock_logger = MagicMock()
-            mock_log_manager.get_heartbeat_logger.return_value = mock_logger
+    async def test_run_once_with_live_api(self, real_coordinator_setup):
+        """Test a single heartbeat cycle fetches real prices."""
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
-            # Create coordinator with real client
-            coordinator = HeartbeatCoordinator(client, db, settings)
+        await symbol_repo.register("BTC/USDT")
 
-            yield coordinator, client, db, settings, mock_logger
+        results = await coordinator.run_once()
 
-        await client.close()
-        await db.close()
+        assert len(results) == 1
+        assert results[0].success is True
+        assert results[0].price > 0
 
 
 @pytest.mark.integration
 class TestCoordinatorWithRealBinance:
-    """Integration tests for coordinator with real Binance API."""
+    """Integration tests for coordinator with a real client against the Binance stub."""
 
-    @pytest.mark.asyncio
-    async def test_run_once_with_real_api(self, real_coordinator_setup):
+    async def test_run_once_with_real_api(self, real_coordinator_setup, beat_watcher):
         """Test running a single heartbeat cycle with real Binance API."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register real symbols
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-        await symbol_repo.register("ETH/USDT")
+        await symbol_repo.register_many(["BTC/USDT", "ETH/USDT"])
 
         # Run a single heartbeat
         results = await coordinator.run_once()
@@ -80,62 +148,54 @@ class TestCoordinatorWithRealBinance:
         assert eth_result.price is not None
         assert eth_result.price > 0
 
-        # Verify logging occurred
-        mock_logger.info.assert_called()
+        # The single cycle was logged once
+        assert beat_watcher.calls == 1
 
-    @pytest.mark.asyncio
     async def test_run_once_stores_prices_in_database(self, real_coordinator_setup):
         """Test that prices fetched from real API are stored in database."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
+        symbol = await symbol_repo.register("BTC/USDT")
 
         # Run heartbeat
         await coordinator.run_once()
 
         # Verify price was stored in database
-        from trading_system.repositories import PriceRepository
-        price_repo = PriceRepository(db)
-        symbol = await symbol_repo.get_by_symbol("BTC/USDT")
         latest = await price_repo.get_latest(symbol.id)
 
         assert latest is not None
         assert latest.close > 0  # Real price should be positive
         assert latest.timestamp > 0
 
-    @pytest.mark.asyncio
     async def test_run_once_updates_symbol_cache(self, real_coordinator_setup):
         """Test that symbol last_price cache is updated after fetch."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
-
-        # Register symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
-        # Verify initial state - no last_price
-        symbol = await symbol_repo.get_by_symbol("BTC/USDT")
+        # Register symbol - initial state has no last_price
+        symbol = await symbol_repo.register("BTC/USDT")
         assert symbol.last_price is None
 
         # Run heartbeat
         await coordinator.run_once()
 
-        # Verify last_price was updated
-        symbol_repo._invalidate_cache()  # Invalidate cache to get fresh data
-        symbol = await symbol_repo.get_by_symbol("BTC/USDT")
+        # Verify last_price was updated (read past the cache)
+        symbol = await symbol_repo.get_by_symbol("BTC/USDT", use_cache=False)
         assert symbol.last_price is not None
         assert symbol.last_price > 0
 
-    @pytest.mark.asyncio
     async def test_run_once_handles_invalid_symbol(self, real_coordinator_setup):
         """Test coordinator handles invalid symbol gracefully with real API."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register one valid and one invalid symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-        await symbol_repo.register("INVALID/SYMBOL123")
+        await symbol_repo.register_many(["BTC/USDT", "INVALID/SYMBOL123"])
 
         # Run heartbeat - should not raise
         results = await coordinator.run_once()
@@ -149,10 +209,11 @@ class TestCoordinatorWithRealBinance:
         # Errors are logged by price_fetcher logger, not heartbeat_logger
         # Just verify that we got failure results for both symbols
 
-    @pytest.mark.asyncio
-    async def test_run_once_with_no_symbols(self, real_coordinator_setup):
+    async def test_run_once_with_no_symbols(self, real_coordinator_setup, beat_watcher):
         """Test coordinator handles no registered symbols."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # No symbols registered
         results = await coordinator.run_once()
@@ -160,25 +221,27 @@ class TestCoordinatorWithRealBinance:
         # Should return empty list
         assert results == []
 
-        # Should log that no symbols are registered
-        # The coordinator logs via heartbeat_logger, check that info was called
-        mock_logger.info.assert_called()
+        # The cycle is still logged via heartbeat_logger, but no beat ran
+        assert beat_watcher.calls == 1
+        assert beat_watcher.completed == 0
 
 
 @pytest.mark.integration
 class TestCoordinatorRealSchedulerIntegration:
     """Integration tests for coordinator with real scheduler timing."""
 
-    @pytest.mark.asyncio
-    async def test_integration_with_real_scheduler_and_api(self, real_coordinator_setup):
+    async def test_integration_with_real_scheduler_and_api(
+        self, real_coordinator_setup, beat_watcher
+    ):
         """Integration test with real scheduler and real Binance API.
 
         Uses very short intervals to test the full scheduling loop.
         """
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register a symbol
-        symbol_repo = SymbolRepository(db)
         await symbol_repo.register("BTC/USDT")
 
         # Use very short intervals for testing
@@ -188,23 +251,22 @@ class TestCoordinatorRealSchedulerIntegration:
         await coordinator.start()
 
         # Wait for a few beats
-        await asyncio.sleep(0.15)
+        await beat_watcher.wait_completed(2)
 
         await coordinator.stop()
 
-        # Should have executed at least one beat
-        assert coordinator.scheduler_stats.beats_executed >= 1
+        # Every reported beat was executed by the scheduler
+        assert coordinator.scheduler_stats.beats_executed >= 2
 
-        # Verify that actual fetches occurred
-        mock_logger.info.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_scheduler_alignment_with_real_fetching(self, real_coordinator_setup):
+    async def test_scheduler_alignment_with_real_fetching(
+        self, real_coordinator_setup, beat_watcher
+    ):
         """Test that scheduler aligns correctly to time boundaries with real fetches."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register symbol
-        symbol_repo = SymbolRepository(db)
         await symbol_repo.register("BTC/USDT")
 
         # Use 1-second interval
@@ -213,32 +275,25 @@ class TestCoordinatorRealSchedulerIntegration:
 
         await coordinator.start()
 
-        # Wait for first beat
-        await asyncio.sleep(0.3)
-
-        # Get stats after first beat
-        stats_after_first = coordinator.scheduler_stats.beats_executed
-
-        # Wait for potential second beat
-        await asyncio.sleep(1.0)
+        # Wait for two beats, one interval boundary apart
+        await beat_watcher.wait_completed(2, timeout=3.0)
 
         await coordinator.stop()
 
-        # Should have executed at least one beat, possibly two
-        assert coordinator.scheduler_stats.beats_executed >= 1
+        assert coordinator.scheduler_stats.beats_executed >= 2
 
 
 @pytest.mark.integration
 class TestCoordinatorErrorHandlingIntegration:
     """Integration tests for coordinator error handling with real API."""
 
-    @pytest.mark.asyncio
-    async def test_graceful_shutdown_during_fetch(self, real_coordinator_setup):
+    async def test_graceful_shutdown_during_fetch(self, real_coordinator_setup, beat_watcher):
         """Test coordinator shuts down gracefully even during active fetching."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register symbol
-        symbol_repo = SymbolRepository(db)
         await symbol_repo.register("BTC/USDT")
 
         # Start with short interval
@@ -247,22 +302,20 @@ class TestCoordinatorErrorHandlingIntegration:
 
         await coordinator.start()
 
-        # Let it run briefly
-        await asyncio.sleep(0.05)
-
-        # Stop immediately (may be mid-fetch)
+        # Stop as soon as a beat has started fetching
+        await beat_watcher.wait_started()
         await coordinator.stop()
 
         # Should not raise and should be stopped
         assert not coordinator.is_running
 
-    @pytest.mark.asyncio
     async def test_multiple_start_stop_cycles(self, real_coordinator_setup):
         """Test coordinator handles multiple start/stop cycles."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register symbol
-        symbol_repo = SymbolRepository(db)
         await symbol_repo.register("BTC/USDT")
 
         for _ in range(3):
@@ -271,18 +324,22 @@ class TestCoordinatorErrorHandlingIntegration:
             await coordinator.stop()
             assert not coordinator.is_running
 
-    @pytest.mark.asyncio
-    async def test_context_manager_with_real_api(self, real_coordinator_setup):
+    async def test_context_manager_with_real_api(self, real_coordinator_setup, beat_watcher):
         """Test async context manager with real Binance API."""
-        coordinator, client, db, settings, mock_logger = real_coordinator_setup
+        coordinator, client, db, settings, mock_logger, symbol_repo, price_repo = (
+            real_coordinator_setup
+        )
 
         # Register symbol
-        symbol_repo = SymbolRepository(db)
         await symbol_repo.register("BTC/USDT")
 
+        # Short interval so a beat happens inside the context
+        coordinator._scheduler._interval = 0
+        coordinator._scheduler._buffer_delay = 0.05
+
         async with coordinator:
             assert coordinator.is_running
             # Let one beat occur
-            await asyncio.sleep(0.1)
+            await beat_watcher.wait_completed()
 
         assert not coordinator.is_running
@@ -1,62 +1,62 @@
-"""Tests for PriceFetcher using real Binance API calls."""
+"""Integration tests for PriceFetcher with a real BinanceClient.
 
-import os
-import tempfile
-from pathlib import Path
+The client talks to the local Binance stub server, so these run without
+network access. A small live smoke test against the actual Binance API is
+deselected by default; run it with ``pytest -m live``.
+"""
 
 import pytest
 import pytest_asyncio
 
-from trading_system.clients import BinanceClient, TickerData
-from trading_system.config import Settings
-from trading_system.database import DatabaseManager
+from trading_system.clients import TickerData
 from trading_system.heartbeat.price_fetcher import PriceFetcher, PriceFetchResult
-from trading_system.repositories import SymbolRepository
+from trading_system.repositories import PriceRepository, SymbolRepository
 
-
-# Real symbols for testing against Binance API
+# Symbols served by the Binance stub (and listed on the real API)
 TEST_SYMBOLS = ["BTC/USDT", "ETH/USDT"]
 
 
-@pytest_asyncio.fixture
-async def real_binance_client():
-    """Create a real Binance client with credentials from environment."""
-    # Load settings from .env file
-    settings = Settings()
+@pytest.fixture
+def binance_client(stub_binance_client):
+    """Binance client used by the fetcher (the shared stub client by default)."""
+    return stub_binance_client
 
-    client = BinanceClient(settings)
-    await client.initialize()
 
-    yield client
+@pytest_asyncio.fixture
+async def setup(clean_db, binance_client):
+    """Create test setup with a real Binance client and the shared database."""
+    db = clean_db
+    fetcher = PriceFetcher(binance_client, db)
+    return fetcher, binance_client, db
 
-    await client.close()
 
+@pytest.mark.integration
+@pytest.mark.live
+class TestPriceFetcherLiveBinance:
+    """Smoke test for PriceFetcher against the actual Binance API."""
 
-@pytest_asyncio.fixture
-async def setup():
-    """Create test setup with real Binance client and database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create database
-        db_path = Path(tmpdir) / "test.db"
-        db = DatabaseManager(db_path)
-        await db.initialize()
+    @pytest.fixture
+    def binance_client(self, live_binance_client):
+        """Use the client connected to the real Binance API instead of the stub."""
+        return live_binance_client
 
-        # Load settings and create real Binance client
-        settings = Settings()
-        client = BinanceClient(settings)
-        await client.initialize()
+    async def test_fetch_all_with_live_api(self, setup):
+        """Test fetching and storing a real price."""
+        fetcher, client, db = setup
 
-        # Create fetcher
-        fetcher = PriceFetcher(client, db)
+        symbol = await SymbolRepository(db).register("BTC/USDT")
 
-        yield fetcher, client, db
+        results = await fetcher.fetch_all()
 
-        await client.close()
-        await db.close()
+        assert len(results) == 1
+        assert results[0].success is True, f"Fetch failed: {results[0].error}"
+        latest = await PriceRepository(db).get_latest(symbol.id)
+        assert latest.close > 0
 
 
-class TestPriceFetcherRealAPI:
-    """Tests for PriceFetcher class using real Binance API."""
+@pytest.mark.integration
+class TestPriceFetcherWithRealBinance:
+    """Tests for PriceFetcher with a real client against the Binance stub."""
 
     @pytest.mark.asyncio
     async def test_fetch_all_no_symbols(self, setup):
@@ -69,7 +69,7 @@ class TestPriceFetcherRealAPI:
 
     @pytest.mark.asyncio
     async def test_fetch_all_success(self, setup):
-        """Test successful price fetch for multiple symbols using real API."""
+        """Test successful price fetch for multiple symbols."""
         fetcher, client, db = setup
 
         # Register symbols
@@ -77,7 +77,7 @@ class TestPriceFetcherRealAPI:
         await symbol_repo.register("BTC/USDT")
         await symbol_repo.register("ETH/USDT")
 
-        # Fetch real prices from Binance API
+        # Fetch prices through the client
         results = await fetcher.fetch_all()
 
         assert len(results) == 2
@@ -108,13 +108,12 @@ class TestPriceFetcherRealAPI:
         await fetcher.fetch_all()
 
         # Verify price was stored
-        from trading_system.repositories import PriceRepository
         price_repo = PriceRepository(db)
         symbol = await symbol_repo.get_by_symbol("BTC/USDT")
         latest = await price_repo.get_latest(symbol.id)
 
         assert latest is not None
-        assert latest.close > 0  # Real price should be positive
+        assert latest.close > 0  # Price should be positive
         assert latest.open == latest.close  # Single-point candle
         assert latest.high == latest.close
         assert latest.low == latest.close
@@ -123,7 +122,7 @@ class TestPriceFetcherRealAPI:
     async def test_fetch_all_with_invalid_symbol_batch_failure(self, setup):
         """Test handling when batch request contains an invalid symbol.
 
-        Real Binance API throws BadSymbol exception for invalid symbols,
+        CCXT raises BadSymbol for a symbol the exchange does not list,
         causing the entire batch to fail gracefully.
         """
         fetcher, client, db = setup
@@ -143,7 +142,7 @@ class TestPriceFetcherRealAPI:
 
     @pytest.mark.asyncio
     async def test_fetch_single_success(self, setup):
-        """Test fetch_single for one symbol using real API."""
+        """Test fetch_single for one symbol."""
         fetcher, client, db = setup
 
         # Register symbol
@@ -179,7 +178,7 @@ class TestPriceFetcherRealAPI:
         result = await fetcher.fetch_single("INVALID/FAKE123")
 
         assert result.success is False
-        # Should get an error from Binance API about invalid symbol
+        # Should get an error about the invalid symbol
         assert result.error is not None
 
     @pytest.mark.asyncio
@@ -194,7 +193,6 @@ class TestPriceFetcherRealAPI:
         await fetcher.fetch_all()
 
         # Verify timestamp was rounded to minute
-        from trading_system.repositories import PriceRepository
         price_repo = PriceRepository(db)
         symbol = await symbol_repo.get_by_symbol("BTC/USDT")
         latest = await price_repo.get_latest(symbol.id)
@@ -221,13 +219,14 @@ class TestPriceFetcherRealAPI:
         assert symbol.last_price > 0
 
 
-class TestPriceFetcherWithRealClientDirectly:
-    """Tests that interact directly with real Binance client."""
+@pytest.mark.integration
+class TestBinanceClientAgainstStub:
+    """Tests that call the real Binance client directly, against the stub."""
 
     @pytest.mark.asyncio
-    async def test_fetch_ticker_returns_valid_data(self, real_binance_client):
-        """Test that fetch_ticker returns valid TickerData from real API."""
-        ticker = await real_binance_client.fetch_ticker("BTC/USDT")
+    async def test_fetch_ticker_returns_valid_data(self, binance_client):
+        """Test that fetch_ticker returns valid TickerData."""
+        ticker = await binance_client.fetch_ticker("BTC/USDT")
 
         assert isinstance(ticker, TickerData)
         assert ticker.symbol == "BTC/USDT"
@@ -238,9 +237,9 @@ class TestPriceFetcherWithRealClientDirectly:
         assert ticker.volume >= 0
 
     @pytest.mark.asyncio
-    async def test_fetch_tickers_batch(self, real_binance_client):
+    async def test_fetch_tickers_batch(self, binance_client):
         """Test that fetch_tickers works with multiple symbols."""
-        tickers = await real_binance_client.fetch_tickers(TEST_SYMBOLS)
+        tickers = await binance_client.fetch_tickers(TEST_SYMBOLS)
 
         assert len(tickers) == 2
         assert "BTC/USDT" in tickers
@@ -4,76 +4,96 @@ These tests validate complete user workflows from start to finish,
 using real components throughout the entire system.
 
 Workflow: Register symbol → Backfill historical data → Heartbeat fetch → Verify data
+
+The Binance client talks to a local Binance stub server, so the workflows
+run without network access. A live smoke test against the actual Binance
+API is deselected by default; run it with ``pytest -m live``.
 """
 
 import asyncio
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import pytest_asyncio
 
-from trading_system.clients import BinanceClient
-from trading_system.config import Settings
-from trading_system.database import DatabaseManager
 from trading_system.heartbeat.coordinator import HeartbeatCoordinator
 from trading_system.repositories import PriceRepository, SymbolRepository
 from trading_system.services import BackfillService
 
 
+@pytest.fixture
+def binance_client(stub_binance_client):
+    """Binance client used by the workflow (the shared stub client by default)."""
+    return stub_binance_client
+
+
 @pytest_asyncio.fixture
-async def full_system_setup():
-    """Create a complete system setup with all real components."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create database
-        db_path = Path(tmpdir) / "test.db"
-        db = DatabaseManager(db_path)
-        await db.initialize()
-
-        # Load settings
-        settings = Settings()
-
-        # Create real Binance client
-        client = BinanceClient(settings)
-        await client.initialize()
-
-        # Create repositories
-        symbol_repo = SymbolRepository(db)
-        price_repo = PriceRepository(db)
-
-        # Create services
-        backfill_service = BackfillService(client, db, settings)
-
-        # Patch log manager for coordinator
-        with patch('trading_system.heartbeat.coordinator.log_manager') as mock_log_manager:
-            mock_logger = MagicMock()
-            mock_log_manager.get_heartbeat_logger.return_value = mock_logger
-
-            # Create coordinator with real client
-            coordinator = HeartbeatCoordinator(client, db, settings)
-
-            yield {
-                'db': db,
-                'client': client,
-                'settings': settings,
-                'symbol_repo': symbol_repo,
-                'price_repo': price_repo,
-                'backfill_service': backfill_service,
-                'coordinator': coordinator,
-                'mock_logger': mock_logger,
-                'tmpdir': tmpdir
-            }
-
-        await client.close()
-        await db.close()
+async def full_system_setup(clean_db, integration_settings, binance_client):
+    """Wire all real components to the shared session database and client."""
+    db = clean_db
+    settings = integration_settings
+    client = binance_client
+
+    # Create repositories
+    symbol_repo = SymbolRepository(db)
+    price_repo = PriceRepository(db)
+
+    # Create services
+    backfill_service = BackfillService(client, db, settings)
+
+    # Patch log manager for coordinator
+    with patch('trading_system.heartbeat.coordinator.log_manager') as mock_log_manager:
+        mock_logger = MagicMock()
+        mock_log_manager.get_heartbeat_logger.return_value = mock_logger
+
+        # Create coordinator with real client, sharing the symbol repository
+        coordinator = HeartbeatCoordinator(client, db, settings, symbol_repo=symbol_repo)
+
+        yield {
+            'db': db,
+            'client': client,
+            'settings': settings,
+            'symbol_repo': symbol_repo,
+            'price_repo': price_repo,
+            'backfill_service': backfill_service,
+            'coordinator': coordinator,
+            'mock_logger': mock_logger,
+        }
+
+
+@pytest.mark.integration
+@pytest.mark.live
+class TestWorkflowLiveBinance:
+    """Smoke test for the full workflow against the actual Binance API."""
+
+    @pytest.fixture
+    def binance_client(self, live_binance_client):
+        """Use the client connected to the real Binance API instead of the stub."""
+        return live_binance_client
+
+    async def test_register_backfill_and_fetch_with_live_api(self, full_system_setup):
+        """Register a symbol, backfill it and fetch its current price."""
+        setup = full_system_setup
+        symbol_repo = setup['symbol_repo']
+        price_repo = setup['price_repo']
+
+        symbol = await symbol_repo.register("BTC/USDT")
+
+        result = await setup['backfill_service'].backfill_symbol(symbol="BTC/USDT", minutes=10)
+        assert result is not None
+
+        results = await setup['coordinator'].run_once()
+        assert len(results) == 1
+        assert results[0].success is True, f"Fetch failed: {results[0].error}"
+
+        latest = await price_repo.get_latest(symbol.id)
+        assert latest.close > 0
 
 
 @pytest.mark.integration
 class TestFullWorkflow:
     """End-to-end workflow tests with all real components."""
 
-    @pytest.mark.asyncio
     async def test_register_symbol_backfill_and_fetch(self, full_system_setup):
         """Complete workflow: register symbol, backfill data, heartbeat fetch, verify."""
         setup = full_system_setup
@@ -103,13 +123,8 @@ class TestFullWorkflow:
 
         # Verify backfill completed
         assert backfill_result is not None
-        print(f"Backfilled {len(backfill_result)} candles")
-
-        # Step 3: Get symbol to check ID for price queries
-        symbol_record = await symbol_repo.get_by_symbol(symbol)
-        assert symbol_record is not None
 
-        # Step 4: Run heartbeat fetch to get current price
+        # Step 3: Run heartbeat fetch to get current price
         # Run once directly instead of using scheduler for predictable results
         results = await coordinator.run_once()
 
@@ -118,24 +133,19 @@ class TestFullWorkflow:
         assert results[0].success is True, f"Fetch failed: {results[0].error}"
         assert results[0].price is not None
 
-        # Step 5: Verify current price was stored
-        latest_price = await price_repo.get_latest(symbol_record.id)
+        # Step 4: Verify current price was stored
+        latest_price = await price_repo.get_latest(registered.id)
         assert latest_price is not None
         assert latest_price.close > 0
         assert latest_price.timestamp > 0
 
-        # Step 6: Verify symbol cache was updated
-        # Clear cache to get fresh data from database
-        symbol_repo._invalidate_cache()
-        updated_symbol = await symbol_repo.get_by_symbol(symbol)
+        # Step 5: Verify symbol cache was updated
+        # Read past the cache to get fresh data from database
+        updated_symbol = await symbol_repo.get_by_symbol(symbol, use_cache=False)
         assert updated_symbol.last_price is not None
         assert updated_symbol.last_price > 0
         assert updated_symbol.last_price_at is not None
 
-        print(f"Latest price: {latest_price.close}")
-        print(f"Symbol cache: {updated_symbol.last_price}")
-
-    @pytest.mark.asyncio
     async def test_multiple_symbols_workflow(self, full_system_setup):
         """Test workflow with multiple symbols."""
         setup = full_system_setup
@@ -145,8 +155,7 @@ class TestFullWorkflow:
         symbols = ["BTC/USDT", "ETH/USDT"]
 
         # Step 1: Register multiple symbols
-        for symbol in symbols:
-            await symbol_repo.register(symbol)
+        await symbol_repo.register_many(symbols)
 
         all_active = await symbol_repo.list_active()
         assert len(all_active) == 2
@@ -164,14 +173,12 @@ class TestFullWorkflow:
             assert result.price > 0
 
         # Step 3: Verify both symbols have cached prices
-        # Invalidate cache to get fresh data with updated last_price
-        symbol_repo._invalidate_cache()
+        # Read past the cache to get fresh data with updated last_price
         for symbol in symbols:
-            symbol_record = await symbol_repo.get_by_symbol(symbol)
+            symbol_record = await symbol_repo.get_by_symbol(symbol, use_cache=False)
             assert symbol_record.last_price is not None
             assert symbol_record.last_price > 0
 
-    @pytest.mark.asyncio
     async def test_symbol_lifecycle_workflow(self, full_system_setup):
         """Test complete symbol lifecycle: register, fetch, deactivate, reactivate."""
         setup = full_system_setup
@@ -188,27 +195,22 @@ class TestFullWorkflow:
         await coordinator.run_once()
 
         # Verify cache updated
-        symbol_repo._invalidate_cache()
-        symbol_record = await symbol_repo.get_by_symbol(symbol)
+        symbol_record = await symbol_repo.get_by_symbol(symbol, use_cache=False)
         assert symbol_record.last_price is not None
 
-        # Deactivate using the coordinator's symbol repo to ensure cache is synchronized
-        # This is necessary because the coordinator uses its own SymbolRepository instance
-        coordinator_symbol_repo = coordinator._price_fetcher._symbol_repo
-        symbol_record = await coordinator_symbol_repo.get_by_symbol(symbol)
-        await coordinator_symbol_repo.deactivate(symbol_record.id)
+        # Deactivate (the coordinator shares this repository and its cache)
+        await symbol_repo.deactivate(registered.id)
 
-        # Verify deactivated in coordinator's repo
-        symbol_record = await coordinator_symbol_repo.get_by_symbol(symbol)
+        # Verify deactivated
+        symbol_record = await symbol_repo.get_by_symbol(symbol)
         assert symbol_record.is_active is False
 
         # Fetch should skip inactive symbol
         results = await coordinator.run_once()
         assert len(results) == 0  # No active symbols
 
-        # Reactivate by re-registering (using coordinator's repo for consistency)
-        await coordinator_symbol_repo.register(symbol)
-        symbol_record = await coordinator_symbol_repo.get_by_symbol(symbol)
+        # Reactivate by re-registering
+        symbol_record = await symbol_repo.register(symbol)
         assert symbol_record.is_active is True
 
         # Fetch should work again
@@ -216,7 +218,6 @@ class TestFullWorkflow:
         assert len(results) == 1
         assert results[0].success is True
 
-    @pytest.mark.asyncio
     async def test_error_recovery_workflow(self, full_system_setup):
         """Test system recovers from errors during workflow."""
         setup = full_system_setup
@@ -224,8 +225,7 @@ class TestFullWorkflow:
         coordinator = setup['coordinator']
 
         # Register valid and invalid symbols
-        await symbol_repo.register("BTC/USDT")
-        await symbol_repo.register("INVALID/SYMBOL123")
+        _, invalid_symbol = await symbol_repo.register_many(["BTC/USDT", "INVALID/SYMBOL123"])
 
         # Run heartbeat - should handle error gracefully
         results = await coordinator.run_once()
@@ -235,10 +235,7 @@ class TestFullWorkflow:
         assert all(not r.success for r in results)
 
         # System should still be operational
-        # Deactivate invalid symbol using coordinator's repo to ensure cache sync
-        coordinator_symbol_repo = coordinator._price_fetcher._symbol_repo
-        invalid_symbol = await coordinator_symbol_repo.get_by_symbol("INVALID/SYMBOL123")
-        await coordinator_symbol_repo.deactivate(invalid_symbol.id)
+        await symbol_repo.deactivate(invalid_symbol.id)
 
         # Now fetch should succeed for valid symbol
         results = await coordinator.run_once()
@@ -247,7 +244,6 @@ class TestFullWorkflow:
         assert results[0].symbol == "BTC/USDT"
         assert results[0].success is True
 
-    @pytest.mark.asyncio
     async def test_data_consistency_workflow(self, full_system_setup):
         """Test data consistency across multiple fetches."""
         setup = full_system_setup
@@ -256,9 +252,7 @@ class TestFullWorkflow:
         coordinator = setup['coordinator']
 
         symbol = "BTC/USDT"
-        await symbol_repo.register(symbol)
-
-        symbol_record = await symbol_repo.get_by_symbol(symbol)
+        symbol_record = await symbol_repo.register(symbol)
 
         # Run multiple fetches
         prices_over_time = []
@@ -267,9 +261,6 @@ class TestFullWorkflow:
             if results and results[0].success:
                 prices_over_time.append(results[0].price)
 
-            # Small delay between fetches
-            await asyncio.sleep(0.1)
-
         # Should have some prices
         assert len(prices_over_time) > 0
 
@@ -284,27 +275,23 @@ class TestFullWorkflow:
 
         # Latest price should match symbol cache
         latest = await price_repo.get_latest(symbol_record.id)
-        symbol_repo._invalidate_cache()  # Invalidate to get fresh symbol data
-        updated_symbol = await symbol_repo.get_by_symbol(symbol)
+        updated_symbol = await symbol_repo.get_by_symbol(symbol, use_cache=False)
         assert latest.close == updated_symbol.last_price
 
 
 @pytest.mark.integration
 class TestBackfillIntegration:
-    """Integration tests for backfill service with real Binance API."""
+    """Integration tests for backfill service with a real client against the Binance stub."""
 
-    @pytest.mark.asyncio
     async def test_backfill_real_historical_data(self, full_system_setup):
-        """Test backfilling real historical data from Binance."""
+        """Test backfilling historical data through the real client."""
         setup = full_system_setup
         symbol_repo = setup['symbol_repo']
         price_repo = setup['price_repo']
         backfill_service = setup['backfill_service']
 
         symbol = "BTC/USDT"
-        await symbol_repo.register(symbol)
-
-        symbol_record = await symbol_repo.get_by_symbol(symbol)
+        symbol_record = await symbol_repo.register(symbol)
 
         # Backfill last 30 minutes
         result = await backfill_service.backfill_symbol(
@@ -315,15 +302,14 @@ class TestBackfillIntegration:
         # Verify backfill completed (may have 0 records if no trades)
         assert result is not None
 
-        # Get stored data count (get_all_for_symbol doesn't exist)
+        # Count stored rows and check the structure of a small recent sample
         price_count = await price_repo.count(symbol_record.id)
-        all_prices = await price_repo.get_range(symbol_record.id, start_time=0, end_time=9999999999999)
-
-        print(f"Backfilled {len(all_prices)} price records")
+        recent_prices = await price_repo.get_latest_n(symbol_record.id, 5)
+        assert len(recent_prices) == min(price_count, 5)
 
         # If data was fetched, verify structure
-        if all_prices:
-            for price in all_prices:
+        if recent_prices:
+            for price in recent_prices:
                 assert price.open > 0
                 assert price.high > 0
                 assert price.low > 0
@@ -333,7 +319,6 @@ class TestBackfillIntegration:
                 assert price.high >= price.open
                 assert price.high >= price.close
 
-    @pytest.mark.asyncio
     async def test_backfill_multiple_symbols(self, full_system_setup):
         """Test backfilling multiple symbols."""
         setup = full_system_setup
@@ -341,13 +326,12 @@ class TestBackfillIntegration:
         backfill_service = setup['backfill_service']
 
         symbols = ["BTC/USDT", "ETH/USDT"]
-        for symbol in symbols:
-            await symbol_repo.register(symbol)
-
-        # Backfill each symbol (short period)
-        for symbol in symbols:
-            result = await backfill_service.backfill_symbol(
-                symbol=symbol,
-                minutes=10
-            )
-            assert result is not None
+        await symbol_repo.register_many(symbols)
+
+        # Backfill all symbols concurrently (short period)
+        results = await asyncio.gather(*(
+            backfill_service.backfill_symbol(symbol=symbol, minutes=10)
+            for symbol in symbols
+        ))
+        assert len(results) == len(symbols)
+        assert all(result is not None for result in results)
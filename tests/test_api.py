@@ -1,36 +1,33 @@
 """Tests for FastAPI REST API."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
 
-from trading_system.api import app, get_db, get_settings
+import trading_system.api as api_module
+from trading_system.api import app, get_db, get_settings, lifespan
 
 
 class TestAPI:
     """Tests for the REST API endpoints."""
 
     @pytest.fixture
-    def client(self):
-        """Create a test client with mocked dependencies."""
-        # Create mock database with async methods
+    def mock_db(self):
+        """Create a mock database with async methods."""
         mock_db = MagicMock()
         mock_db.fetch_one = AsyncMock(return_value={"1": 1})
+        return mock_db
 
-        # Create mock settings
-        mock_settings = MagicMock()
-        mock_settings.db_path = ":memory:"
+    @pytest.fixture(autouse=True)
+    def override_dependencies(self, override_api, mock_db):
+        """Point the app's dependencies at the mocks for one test."""
+        override_api({get_db: mock_db, get_settings: SimpleNamespace(db_path=":memory:")})
 
-        # Override dependencies
-        app.dependency_overrides[get_db] = lambda: mock_db
-        app.dependency_overrides[get_settings] = lambda: mock_settings
-
-        with TestClient(app) as test_client:
-            yield test_client, mock_db
-
-        # Clear overrides after test
-        app.dependency_overrides.clear()
+    @pytest.fixture
+    def client(self, api_client, mock_db):
+        """Provide the shared test client and this test's mock database."""
+        return api_client, mock_db
 
     def test_root_endpoint(self, client):
         """Test root endpoint returns API information."""
@@ -81,8 +78,7 @@ class TestAPILifespan:
         mock_db_instance.initialize = AsyncMock()
         mock_db_instance.close = AsyncMock()
 
-        mock_settings_instance = MagicMock()
-        mock_settings_instance.db_path = ":memory:"
+        mock_settings_instance = SimpleNamespace(db_path=":memory:")
 
         mock_binance_instance = MagicMock()
         mock_binance_instance.initialize = AsyncMock()
@@ -100,8 +96,6 @@ class TestAPILifespan:
             mock_binance_class.return_value = mock_binance_instance
             mock_backfill_class.return_value = mock_backfill_instance
 
-            from trading_system.api import lifespan
-
             async with lifespan(app):
                 # During lifespan, database should be initialized
                 mock_db_instance.initialize.assert_called_once()
@@ -118,8 +112,7 @@ class TestAPILifespan:
         mock_db_instance.initialize = AsyncMock(side_effect=Exception("Init failed"))
         mock_db_instance.close = AsyncMock()
 
-        mock_settings_instance = MagicMock()
-        mock_settings_instance.db_path = ":memory:"
+        mock_settings_instance = SimpleNamespace(db_path=":memory:")
 
         with patch("trading_system.api.DatabaseManager") as mock_db_class, \
              patch("trading_system.api.Settings") as mock_settings_class, \
@@ -128,8 +121,6 @@ class TestAPILifespan:
             mock_db_class.return_value = mock_db_instance
             mock_settings_class.return_value = mock_settings_instance
 
-            from trading_system.api import lifespan
-
             # Exception during initialize should still cleanup
             with pytest.raises(Exception, match="Init failed"):
                 async with lifespan(app):
@@ -142,38 +133,18 @@ class TestAPILifespan:
 class TestAPIHelpers:
     """Tests for API helper functions."""
 
-    def test_get_db_raises_when_not_initialized(self):
+    async def test_get_db_raises_when_not_initialized(self, monkeypatch):
         """Test get_db raises RuntimeError when database is not initialized."""
-        from trading_system.api import _db
+        # Simulate uninitialized state; monkeypatch restores the original
+        monkeypatch.setattr(api_module, "_db", None)
 
-        # Store original value
-        original_db = _db
+        with pytest.raises(RuntimeError, match="Database not initialized"):
+            await get_db()
 
-        try:
-            # Set to None to simulate uninitialized state
-            import trading_system.api as api_module
-            api_module._db = None
-
-            with pytest.raises(RuntimeError, match="Database not initialized"):
-                get_db()
-        finally:
-            # Restore original value
-            api_module._db = original_db
-
-    def test_get_settings_raises_when_not_initialized(self):
+    async def test_get_settings_raises_when_not_initialized(self, monkeypatch):
         """Test get_settings raises RuntimeError when settings are not initialized."""
-        from trading_system.api import _settings
-
-        # Store original value
-        original_settings = _settings
-
-        try:
-            # Set to None to simulate uninitialized state
-            import trading_system.api as api_module
-            api_module._settings = None
+        # Simulate uninitialized state; monkeypatch restores the original
+        monkeypatch.setattr(api_module, "_settings", None)
 
-            with pytest.raises(RuntimeError, match="Settings not initialized"):
-                get_settings()
-        finally:
-            # Restore original value
-            api_module._settings = original_settings
+        with pytest.raises(RuntimeError, match="Settings not initialized"):
+            await get_settings()
@@ -1,132 +1,112 @@
 """Tests for plotting API endpoints."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
-from fastapi.testclient import TestClient
 
-from trading_system.api import app, get_db, get_settings
+from trading_system.api import _PRICE_CHART_LAYOUT, get_db, get_settings
+from trading_system.database import DatabaseManager
+
+# Price rows returned by the mocked database (read-only, shared across tests)
+_BTC_ETH_PRICES = (
+    {"symbol": "BTC/USDT", "timestamp": 1704067200000, "close": 42000.0},  # 2024-01-01 00:00:00 UTC
+    {"symbol": "BTC/USDT", "timestamp": 1704067260000, "close": 42100.0},  # +1 minute
+    {"symbol": "ETH/USDT", "timestamp": 1704067200000, "close": 2200.0},
+    {"symbol": "ETH/USDT", "timestamp": 1704067260000, "close": 2210.0},
+)
+_BTC_PRICE = (
+    {"symbol": "BTC/USDT", "timestamp": 1704067200000, "close": 42000.0},
+)
 
 
 class TestAPIPlotting:
     """Tests for the plotting API endpoints."""
 
     @pytest.fixture
-    def client_with_mocks(self):
-        """Create a test client with mocked dependencies."""
-        mock_db = MagicMock()
-        mock_settings = MagicMock()
-
-        app.dependency_overrides[get_db] = lambda: mock_db
-        app.dependency_overrides[get_settings] = lambda: mock_settings
+    def mock_db(self):
+        """Create a mock database restricted to the DatabaseManager interface."""
+        return MagicMock(spec_set=DatabaseManager)
 
-        with TestClient(app) as test_client:
-            yield test_client, mock_db
+    @pytest.fixture(autouse=True)
+    def override_dependencies(self, override_api, mock_db):
+        """Point the app's dependencies at the mocks for one test."""
+        override_api({get_db: mock_db, get_settings: SimpleNamespace()})
 
-        app.dependency_overrides.clear()
-
-    def test_plot_prices_empty_data(self, client_with_mocks):
-        """Test plotting endpoint with no price data."""
-        client, mock_db = client_with_mocks
-
-        # Mock empty result
-        mock_db.fetch_all = AsyncMock(return_value=[])
-
-        response = client.get("/plot/prices")
-
-        assert response.status_code == 200
-        assert "No price data available" in response.text
-
-    def test_plot_prices_with_data(self, client_with_mocks):
-        """Test plotting endpoint returns HTML with Plotly chart."""
+    @pytest.fixture
+    def client_with_mocks(self, api_client, mock_db):
+        """Provide the shared test client and this test's mock database."""
+        return api_client, mock_db
+
+    @pytest.mark.parametrize(
+        ("rows", "expected_fragments"),
+        [
+            pytest.param(
+                [],
+                (b"No price data available",),
+                id="empty-data",
+            ),
+            pytest.param(
+                _BTC_ETH_PRICES,
+                (b"plotly", b"Historical Price Data", b"2 symbol(s)", b"chart-container"),
+                id="with-data",
+            ),
+            # Plotly log scale is set via "type": "log" in the yaxis config
+            pytest.param(
+                _BTC_PRICE,
+                (b'"type":"log"',),
+                id="log-scale",
+            ),
+        ],
+    )
+    def test_plot_prices(self, client_with_mocks, rows, expected_fragments):
+        """Test plotting endpoint returns HTML containing the expected fragments."""
         client, mock_db = client_with_mocks
-
-        # Mock price data for multiple symbols
-        mock_db.fetch_all = AsyncMock(return_value=[
-            {
-                "symbol": "BTC/USDT",
-                "timestamp": 1704067200000,  # 2024-01-01 00:00:00 UTC
-                "close": 42000.0,
-            },
-            {
-                "symbol": "BTC/USDT",
-                "timestamp": 1704067260000,  # +1 minute
-                "close": 42100.0,
-            },
-            {
-                "symbol": "ETH/USDT",
-                "timestamp": 1704067200000,
-                "close": 2200.0,
-            },
-            {
-                "symbol": "ETH/USDT",
-                "timestamp": 1704067260000,
-                "close": 2210.0,
-            },
-        ])
+        mock_db.fetch_all.return_value = rows
 
         response = client.get("/plot/prices")
 
         assert response.status_code == 200
-        # Should return HTML
         assert response.headers["content-type"] == "text/html; charset=utf-8"
-        # Should contain Plotly
-        assert "plotly" in response.text.lower()
-        # Should contain the chart title
-        assert "Historical Price Data" in response.text
-        # Should indicate 2 symbols in subtitle
-        assert "2 symbol(s)" in response.text
-        # Should have chart container
-        assert "chart-container" in response.text
+        # Search the raw body once instead of decoding response.text per check
+        body = response.content
+        for fragment in expected_fragments:
+            assert fragment in body
 
-    def test_plot_prices_log_scale(self, client_with_mocks):
-        """Test that chart uses log scale Y-axis."""
+    def test_plot_prices_reuses_layout_unchanged(self, client_with_mocks):
+        """Test that rendering charts leaves the shared module-level layout intact."""
         client, mock_db = client_with_mocks
+        layout_before = _PRICE_CHART_LAYOUT.to_plotly_json()
 
-        mock_db.fetch_all = AsyncMock(return_value=[
-            {
-                "symbol": "BTC/USDT",
-                "timestamp": 1704067200000,
-                "close": 42000.0,
-            },
-        ])
-
-        response = client.get("/plot/prices")
+        mock_db.fetch_all.return_value = _BTC_ETH_PRICES
+        first = client.get("/plot/prices")
+        mock_db.fetch_all.return_value = _BTC_PRICE
+        second = client.get("/plot/prices")
 
-        assert response.status_code == 200
-        # Plotly log scale is set via 'type': 'log' in yaxis config
-        assert '"type":"log"' in response.text or "'type': 'log'" in response.text
+        assert first.status_code == second.status_code == 200
+        assert b"2 symbol(s)" in first.content
+        assert b"1 symbol(s)" in second.content
+        assert _PRICE_CHART_LAYOUT.to_plotly_json() == layout_before
 
 
+@pytest.mark.integration
 class TestAPIPlottingIntegration:
     """Integration tests for plotting with real database."""
 
     @pytest.fixture
-    async def real_db(self):
-        """Create a real database for integration testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            from trading_system.database import DatabaseManager
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
-            yield db
-            await db.close()
+    async def real_db(self, clean_db):
+        """Provide the shared session database, emptied for this test."""
+        return clean_db
 
     @pytest.fixture
-    def client_with_real_db(self, real_db):
-        """Create a test client with real database."""
-        from trading_system.config import Settings
-        mock_settings = Settings()
-
-        app.dependency_overrides[get_db] = lambda: real_db
-        app.dependency_overrides[get_settings] = lambda: mock_settings
-
-        with TestClient(app) as test_client:
-            yield test_client, real_db
+    def client_with_real_db(self, api_async_client, override_api, real_db, env_settings):
+        """Provide the async API client wired to the real database.
 
-        app.dependency_overrides.clear()
+        The ASGI transport never runs the app lifespan, so no Binance client
+        or data/trading.db is opened.
+        """
+        override_api({get_db: real_db, get_settings: env_settings})
+        return api_async_client, real_db
 
     @pytest.mark.asyncio
     async def test_plot_prices_integration(self, client_with_real_db):
@@ -134,40 +114,36 @@ class TestAPIPlottingIntegration:
         client, db = client_with_real_db
 
         # Insert test symbols
-        await db.execute(
+        await db.executemany(
             "INSERT INTO symbols (symbol, is_active) VALUES (?, 1)",
-            ("BTC/USDT",)
-        )
-        await db.execute(
-            "INSERT INTO symbols (symbol, is_active) VALUES (?, 1)",
-            ("ETH/USDT",)
+            [("BTC/USDT",), ("ETH/USDT",)]
         )
 
         # Get symbol IDs
-        btc_row = await db.fetch_one(
-            "SELECT id FROM symbols WHERE symbol = ?", ("BTC/USDT",)
-        )
-        eth_row = await db.fetch_one(
-            "SELECT id FROM symbols WHERE symbol = ?", ("ETH/USDT",)
-        )
+        ids = {
+            row["symbol"]: row["id"]
+            for row in await db.fetch_all("SELECT id, symbol FROM symbols")
+        }
 
         # Insert price data
         base_time = 1704067200000  # 2024-01-01 00:00:00 UTC
+        rows = []
         for i in range(5):
-            await db.execute(
-                """INSERT INTO price_data 
-                    (symbol_id, timestamp, open, high, low, close, volume)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (btc_row["id"], base_time + i * 60000, 42000.0, 42100.0, 41900.0, 42050.0 + i * 10, 100.0)
+            rows.append(
+                (ids["BTC/USDT"], base_time + i * 60000,
+                 42000.0, 42100.0, 41900.0, 42050.0 + i * 10, 100.0)
             )
-            await db.execute(
-                """INSERT INTO price_data 
-                    (symbol_id, timestamp, open, high, low, close, volume)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (eth_row["id"], base_time + i * 60000, 2200.0, 2210.0, 2190.0, 2205.0 + i, 500.0)
+            rows.append(
+                (ids["ETH/USDT"], base_time + i * 60000, 2200.0, 2210.0, 2190.0, 2205.0 + i, 500.0)
             )
+        await db.executemany(
+            """INSERT INTO price_data
+                (symbol_id, timestamp, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+            rows
+        )
 
-        response = client.get("/plot/prices")
+        response = await client.get("/plot/prices")
 
         assert response.status_code == 200
         # Should have the chart title
@@ -1,65 +1,120 @@
 """Tests for symbol management API endpoints."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from urllib.parse import quote
 
 import pytest
-from fastapi.testclient import TestClient
 
-from trading_system.api import app, get_backfill_service, get_db, get_settings
+from trading_system.api import get_backfill_service, get_db, get_settings
+
+# Symbol path for BTC/USDT, with the slash percent-encoded
+_BTC_USDT_PATH = "/symbols/" + quote("BTC/USDT", safe="")
+
+# Row the mocked database returns for a newly registered symbol
+_CREATED_ROW = {
+    "id": 1,
+    "symbol": "BTC/USDT",
+    "is_active": 1,
+    "created_at": "2024-01-01T00:00:00",
+    "last_price": None,
+    "last_price_at": None,
+}
+
+
+def _const_coro(value):
+    """Build an async stub that always returns ``value``.
+
+    Cheaper than AsyncMock, which records every call; used wherever a test
+    never asserts on the calls.
+    """
+    async def stub(*args, **kwargs):
+        return value
+
+    return stub
+
+
+def _make_fetch_one(created_row):
+    """Build a fetch_one stub for symbol creation.
+
+    Lookups by symbol find nothing (not registered yet); lookups by the
+    created row's ID return that row. Matches on the bound parameter, not
+    the SQL text, so rewording a query does not change what the stub returns.
+    """
+    async def fetch_one(query, params=(), *args, **kwargs):
+        if tuple(params) == (created_row["id"],):
+            return created_row
+        return None
+
+    return fetch_one
 
 
 class TestAPISymbols:
     """Tests for the symbol management API endpoints."""
 
     @pytest.fixture
-    def client_with_mocks(self):
-        """Create a test client with mocked dependencies."""
+    def client_with_mocks(self, api_async_client, override_api):
+        """Provide the shared test client with dependencies mocked for one test."""
         # Create mock database
         mock_db = MagicMock()
-        mock_db.fetch_one = AsyncMock(return_value={"1": 1})
+        mock_db.fetch_one = _const_coro({"1": 1})
 
         # Create mock settings
-        mock_settings = MagicMock()
-        mock_settings.db_path = ":memory:"
-        mock_settings.backfill_minutes = 5
+        mock_settings = SimpleNamespace(db_path=":memory:", backfill_minutes=5)
 
         # Create mock backfill service
         mock_backfill_service = MagicMock()
 
-        # Override dependencies
-        app.dependency_overrides[get_db] = lambda: mock_db
-        app.dependency_overrides[get_settings] = lambda: mock_settings
-        app.dependency_overrides[get_backfill_service] = lambda: mock_backfill_service
+        override_api({
+            get_db: mock_db,
+            get_settings: mock_settings,
+            get_backfill_service: mock_backfill_service,
+        })
+        return api_async_client, mock_db, mock_backfill_service
+
+    @pytest.fixture
+    def create_symbol_mocks(self, client_with_mocks):
+        """Wire the mocks for registering a new symbol.
+
+        Tests only need to set ``backfill_symbol``'s result or side effect.
+        """
+        _, mock_db, mock_backfill = client_with_mocks
+
+        mock_db.fetch_one = _make_fetch_one(_CREATED_ROW)
+
+        # Mock cursor for INSERT
+        mock_cursor = MagicMock()
+        mock_cursor.lastrowid = 1
+        mock_db.execute = _const_coro(mock_cursor)
 
-        with TestClient(app) as test_client:
-            yield test_client, mock_db, mock_backfill_service
+        mock_backfill.backfill_symbol = AsyncMock()
+        mock_backfill.get_backfill_status = _const_coro({
+            "symbol": "BTC/USDT",
+            "total_records": 0,
+        })
 
-        # Clear overrides after test
-        app.dependency_overrides.clear()
+        return client_with_mocks
 
-    def test_list_symbols_empty(self, client_with_mocks):
+    async def test_list_symbols_empty(self, client_with_mocks):
         """Test listing symbols when no symbols are registered."""
         client, mock_db, _ = client_with_mocks
 
         # Mock empty list
-        mock_db.fetch_all = AsyncMock(return_value=[])
+        mock_db.fetch_all = _const_coro([])
 
-        response = client.get("/symbols")
+        response = await client.get("/symbols")
 
         assert response.status_code == 200
         data = response.json()
         assert data["symbols"] == []
         assert data["count"] == 0
 
-    def test_list_symbols_with_data(self, client_with_mocks):
+    async def test_list_symbols_with_data(self, client_with_mocks):
         """Test listing symbols with registered symbols."""
         client, mock_db, _ = client_with_mocks
 
         # Mock symbols in database
-        mock_db.fetch_all = AsyncMock(return_value=[
+        mock_db.fetch_all = _const_coro([
             {
                 "id": 1,
                 "symbol": "BTC/USDT",
@@ -78,7 +133,7 @@ class TestAPISymbols:
             },
         ])
 
-        response = client.get("/symbols")
+        response = await client.get("/symbols")
 
         assert response.status_code == 200
         data = response.json()
@@ -90,12 +145,12 @@ class TestAPISymbols:
         assert btc["is_active"] is True
         assert btc["last_price"] == 50000.0
 
-    def test_list_symbols_inactive_filter(self, client_with_mocks):
+    async def test_list_symbols_inactive_filter(self, client_with_mocks):
         """Test listing symbols with active_only=false includes inactive."""
         client, mock_db, _ = client_with_mocks
 
         # Mock symbols including inactive
-        mock_db.fetch_all = AsyncMock(return_value=[
+        mock_db.fetch_all = _const_coro([
             {
                 "id": 1,
                 "symbol": "BTC/USDT",
@@ -114,18 +169,18 @@ class TestAPISymbols:
             },
         ])
 
-        response = client.get("/symbols?active_only=false")
+        response = await client.get("/symbols?active_only=false")
 
         assert response.status_code == 200
         data = response.json()
         assert data["count"] == 2
 
-    def test_get_symbol_success(self, client_with_mocks):
+    async def test_get_symbol_success(self, client_with_mocks):
         """Test getting a specific symbol that exists."""
         client, mock_db, _ = client_with_mocks
 
         # Mock symbol in database
-        mock_db.fetch_one = AsyncMock(return_value={
+        mock_db.fetch_one = _const_coro({
             "id": 1,
             "symbol": "BTC/USDT",
             "is_active": 1,
@@ -134,7 +189,7 @@ class TestAPISymbols:
             "last_price_at": "2024-01-01T01:00:00",
         })
 
-        response = client.get(f"/symbols/{quote('BTC/USDT', safe='')}")
+        response = await client.get(_BTC_USDT_PATH)
 
         assert response.status_code == 200
         data = response.json()
@@ -142,64 +197,31 @@ class TestAPISymbols:
         assert data["is_active"] is True
         assert data["last_price"] == 50000.0
 
-    def test_get_symbol_not_found(self, client_with_mocks):
+    async def test_get_symbol_not_found(self, client_with_mocks):
         """Test getting a symbol that doesn't exist returns 404."""
         client, mock_db, _ = client_with_mocks
 
         # Mock no symbol found
-        mock_db.fetch_one = AsyncMock(return_value=None)
+        mock_db.fetch_one = _const_coro(None)
 
-        response = client.get("/symbols/INVALID%2FPAIR")
+        response = await client.get("/symbols/INVALID%2FPAIR")
 
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    def test_create_symbol_success(self, client_with_mocks):
+    async def test_create_symbol_success(self, create_symbol_mocks):
         """Test creating a new symbol successfully."""
-        client, mock_db, mock_backfill = client_with_mocks
-
-        # Track calls to return different values
-        call_count = {"fetch_one": 0}
-
-        async def mock_fetch_one(*args, **kwargs):
-            call_count["fetch_one"] += 1
-            query = args[0] if args else ""
-            # First call checks for duplicate by symbol
-            if call_count["fetch_one"] == 1 and "symbol =" in query:
-                return None  # No existing symbol
-            # Second call fetches created symbol by ID
-            elif "id =" in query:
-                return {
-                    "id": 1,
-                    "symbol": "BTC/USDT",
-                    "is_active": 1,
-                    "created_at": "2024-01-01T00:00:00",
-                    "last_price": None,
-                    "last_price_at": None,
-                }
-            return None
-
-        mock_db.fetch_one = mock_fetch_one
+        client, _, mock_backfill = create_symbol_mocks
 
-        # Mock cursor for INSERT
-        mock_cursor = MagicMock()
-        mock_cursor.lastrowid = 1
-        mock_db.execute = AsyncMock(return_value=mock_cursor)
-
-        # Mock backfill service
-        mock_backfill.backfill_symbol = AsyncMock(return_value={
+        mock_backfill.backfill_symbol.return_value = {
             "symbol": "BTC/USDT",
             "status": "success",
             "strategy": "full_backfill",
             "records_stored": 1,
-        })
-        mock_backfill.get_backfill_status = AsyncMock(return_value={
-            "symbol": "BTC/USDT",
-            "total_records": 1,
-        })
+        }
 
-        response = client.post("/symbols", json={"symbol": "BTC/USDT"})
+        response = await client.post("/symbols", json={"symbol": "BTC/USDT"})
 
         assert response.status_code == 201
         data = response.json()
@@ -210,66 +232,27 @@ class TestAPISymbols:
         # Verify backfill was called
         mock_backfill.backfill_symbol.assert_called_once_with("BTC/USDT")
 
-    def test_create_symbol_duplicate(self, client_with_mocks):
+    async def test_create_symbol_duplicate(self, client_with_mocks):
         """Test creating a duplicate symbol returns 400."""
         client, mock_db, _ = client_with_mocks
 
         # Mock existing active symbol
-        mock_db.fetch_one = AsyncMock(return_value={
-            "id": 1,
-            "symbol": "BTC/USDT",
-            "is_active": 1,
-            "created_at": "2024-01-01T00:00:00",
-            "last_price": None,
-            "last_price_at": None,
-        })
+        mock_db.fetch_one = _const_coro(_CREATED_ROW)
 
-        response = client.post("/symbols", json={"symbol": "BTC/USDT"})
+        response = await client.post("/symbols", json={"symbol": "BTC/USDT"})
 
         assert response.status_code == 400
         data = response.json()
         assert "already registered" in data["detail"].lower()
 
-    def test_create_symbol_backfill_failure(self, client_with_mocks):
+    async def test_create_symbol_backfill_failure(self, create_symbol_mocks):
         """Test symbol creation succeeds even if backfill fails."""
-        client, mock_db, mock_backfill = client_with_mocks
-
-        # Track calls to return different values
-        call_count = {"fetch_one": 0}
-
-        async def mock_fetch_one(*args, **kwargs):
-            call_count["fetch_one"] += 1
-            query = args[0] if args else ""
-            if call_count["fetch_one"] == 1 and "symbol =" in query:
-                return None
-            elif "id =" in query:
-                return {
-                    "id": 1,
-                    "symbol": "BTC/USDT",
-                    "is_active": 1,
-                    "created_at": "2024-01-01T00:00:00",
-                    "last_price": None,
-                    "last_price_at": None,
-                }
-            return None
-
-        mock_db.fetch_one = mock_fetch_one
-
-        # Mock cursor for INSERT
-        mock_cursor = MagicMock()
-        mock_cursor.lastrowid = 1
-        mock_db.execute = AsyncMock(return_value=mock_cursor)
+        client, _, mock_backfill = create_symbol_mocks
 
         # Mock backfill service to fail
-        mock_backfill.backfill_symbol = AsyncMock(
-            side_effect=Exception("Network error")
-        )
-        mock_backfill.get_backfill_status = AsyncMock(return_value={
-            "symbol": "BTC/USDT",
-            "total_records": 0,
-        })
+        mock_backfill.backfill_symbol.side_effect = Exception("Network error")
 
-        response = client.post("/symbols", json={"symbol": "BTC/USDT"})
+        response = await client.post("/symbols", json={"symbol": "BTC/USDT"})
 
         # Should still succeed (201) even if backfill fails
         assert response.status_code == 201
@@ -277,93 +260,80 @@ class TestAPISymbols:
         assert "backfill failed" in data["message"].lower()
         assert "backfill_error" in data["backfill_status"]
 
-    def test_create_symbol_invalid_format(self, client_with_mocks):
+    async def test_create_symbol_invalid_format(self, client_with_mocks):
         """Test creating a symbol with invalid format."""
         client, _, _ = client_with_mocks
 
         # Empty symbol should fail validation
-        response = client.post("/symbols", json={"symbol": ""})
+        response = await client.post("/symbols", json={"symbol": ""})
 
         # FastAPI/Pydantic validation error
         assert response.status_code == 422
 
-    def test_create_symbol_missing_field(self, client_with_mocks):
+    async def test_create_symbol_missing_field(self, client_with_mocks):
         """Test creating a symbol without required field."""
         client, _, _ = client_with_mocks
 
-        response = client.post("/symbols", json={})
+        response = await client.post("/symbols", json={})
 
         assert response.status_code == 422
         data = response.json()
         assert "symbol" in str(data["detail"]).lower()
 
 
+@pytest.mark.integration
 class TestAPISymbolsIntegration:
     """Integration tests for symbol API with real database."""
 
     @pytest.fixture
-    async def real_db(self):
-        """Create a real database for integration testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            from trading_system.database import DatabaseManager
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
-            yield db
-            await db.close()
+    async def real_db(self, clean_db):
+        """Provide the shared session database, emptied for this test."""
+        return clean_db
 
     @pytest.fixture
-    def client_with_real_db(self, real_db):
+    def client_with_real_db(self, api_async_client, override_api, real_db, env_settings):
         """Create a test client with real database but mocked backfill."""
-        from trading_system.config import Settings
-
-        mock_settings = Settings()
-
         # Mock backfill service
         mock_backfill = MagicMock()
-        mock_backfill.backfill_symbol = AsyncMock(return_value={
+        mock_backfill.backfill_symbol = _const_coro({
             "symbol": "BTC/USDT",
             "status": "success",
             "strategy": "full_backfill",
             "records_stored": 0,
         })
-        mock_backfill.get_backfill_status = AsyncMock(return_value={
+        mock_backfill.get_backfill_status = _const_coro({
             "symbol": "BTC/USDT",
             "total_records": 0,
         })
 
-        app.dependency_overrides[get_db] = lambda: real_db
-        app.dependency_overrides[get_settings] = lambda: mock_settings
-        app.dependency_overrides[get_backfill_service] = lambda: mock_backfill
-
-        with TestClient(app) as test_client:
-            yield test_client, real_db
-
-        app.dependency_overrides.clear()
+        override_api({
+            get_db: real_db,
+            get_settings: env_settings,
+            get_backfill_service: mock_backfill,
+        })
+        return api_async_client, real_db
 
-    @pytest.mark.asyncio
     async def test_create_and_list_symbol_integration(self, client_with_real_db):
         """Test creating a symbol and then listing it."""
         client, db = client_with_real_db
 
         # Create symbol
-        response = client.post("/symbols", json={"symbol": "BTC/USDT"})
+        response = await client.post("/symbols", json={"symbol": "BTC/USDT"})
         assert response.status_code == 201
 
         # List symbols
-        response = client.get("/symbols")
+        response = await client.get("/symbols")
         assert response.status_code == 200
         data = response.json()
         assert data["count"] == 1
         assert data["symbols"][0]["symbol"] == "BTC/USDT"
 
-    @pytest.mark.asyncio
     async def test_create_symbol_persists_to_database(self, client_with_real_db):
         """Test that created symbol is actually stored in database."""
         client, db = client_with_real_db
 
         # Create symbol via API
-        response = client.post("/symbols", json={"symbol": "ETH/USDT"})
+        response = await client.post("/symbols", json={"symbol": "ETH/USDT"})
         assert response.status_code == 201
 
         # Verify directly in database
@@ -372,16 +342,15 @@ class TestAPISymbolsIntegration:
         assert row["symbol"] == "ETH/USDT"
         assert row["is_active"] == 1
 
-    @pytest.mark.asyncio
     async def test_get_symbol_after_creation(self, client_with_real_db):
         """Test getting a symbol after creating it."""
         client, db = client_with_real_db
 
         # Create symbol
-        client.post("/symbols", json={"symbol": "BTC/USDT"})
+        await client.post("/symbols", json={"symbol": "BTC/USDT"})
 
         # Get symbol
-        response = client.get(f"/symbols/{quote('BTC/USDT', safe='')}")
+        response = await client.get(_BTC_USDT_PATH)
         assert response.status_code == 200
         data = response.json()
         assert data["symbol"] == "BTC/USDT"
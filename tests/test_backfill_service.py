@@ -1,102 +1,102 @@
 """Tests for BackfillService."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock
 
 import pytest
 
-from trading_system.clients import BinanceClient, OHLCVData
+from trading_system.clients import OHLCVData
 from trading_system.config import Settings
-from trading_system.database import DatabaseManager
 from trading_system.repositories import PriceRepository, SymbolRepository
 from trading_system.services import BackfillService
 
+from .fakes import FakeBinanceClient
+
+# Built once; tests that need other values use model_copy(update=...)
+_TEST_SETTINGS = Settings(
+    binance_api_key="test_key",
+    binance_api_secret="test_secret",
+    backfill_minutes=5,
+    gap_fill_enabled=True,
+    gap_fill_threshold_minutes=1,
+    max_gap_fill_minutes=1000,
+)
+
+# Clock of the fake client, and the last complete minute the service backfills to
+_FIXED_NOW_MS = 1_000_000_000_000
+_MINUTE_MS = 60_000
+_UNTIL_MS = (_FIXED_NOW_MS // _MINUTE_MS) * _MINUTE_MS - _MINUTE_MS
+
+# Candles returned by the mocked client; the service only reads them, so
+# the same instances are shared by every test
+_BASE_TS = _UNTIL_MS - 2 * _MINUTE_MS
+
+_SAMPLE_CANDLES = (
+    OHLCVData(timestamp=_BASE_TS, open=100.0, high=110.0, low=90.0, close=105.0, volume=1000.0),
+    OHLCVData(
+        timestamp=_BASE_TS + _MINUTE_MS,
+        open=105.0, high=115.0, low=95.0, close=110.0, volume=2000.0,
+    ),
+    OHLCVData(
+        timestamp=_BASE_TS + 2 * _MINUTE_MS,
+        open=110.0, high=120.0, low=100.0, close=115.0, volume=3000.0,
+    ),
+)
+
+# Not on a minute boundary; stored rounded down
+_UNALIGNED_CANDLE = OHLCVData(
+    timestamp=_UNTIL_MS - 6000, open=100.0, high=110.0, low=90.0, close=105.0, volume=1000.0
+)
+
+
+def _minute_candles(start_ts, count):
+    """Build ``count`` consecutive one-minute candles for save_many()."""
+    return [
+        {
+            "timestamp": start_ts + i * _MINUTE_MS,
+            "open": 100.0 + i,
+            "high": 110.0 + i,
+            "low": 90.0 + i,
+            "close": 105.0 + i,
+            "volume": 1000.0,
+        }
+        for i in range(count)
+    ]
+
 
 class TestBackfillService:
     """Tests for BackfillService class."""
 
     @pytest.fixture
-    async def setup(self):
-        """Create test setup with mocked components."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create database
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
-
-            # Create settings
-            settings = Settings(
-                binance_api_key="test_key",
-                binance_api_secret="test_secret",
-                backfill_minutes=5,
-                gap_fill_enabled=True,
-                gap_fill_threshold_minutes=1,
-                max_gap_fill_minutes=1000,
-            )
-
-            # Create mocked Binance client
-            mock_client = MagicMock(spec=BinanceClient)
-            mock_client.milliseconds = 1000000000000  # Fixed timestamp
-
-            # Create service
-            service = BackfillService(mock_client, db, settings)
-
-            yield service, mock_client, db
-
-            await db.close()
-
-    @pytest.fixture
-    async def setup_with_data(self):
-        """Create test setup with existing price data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
+    async def setup(self, clean_db):
+        """Create test setup with a fake client on the shared database."""
+        mock_client = FakeBinanceClient(_FIXED_NOW_MS)
 
-            settings = Settings(
-                binance_api_key="test_key",
-                binance_api_secret="test_secret",
-                backfill_minutes=5,
-                gap_fill_enabled=True,
-                gap_fill_threshold_minutes=1,
-                max_gap_fill_minutes=1000,
-            )
+        service = BackfillService(mock_client, clean_db, _TEST_SETTINGS)
 
-            mock_client = MagicMock(spec=BinanceClient)
-            # Current time: 1000000000000
-            mock_client.milliseconds = 1000000000000
+        # Fresh repositories too: the symbol cache must not outlive the rows
+        symbol_repo = SymbolRepository(clean_db)
+        price_repo = PriceRepository(clean_db)
 
-            service = BackfillService(mock_client, db, settings)
+        return service, mock_client, clean_db, symbol_repo, price_repo
 
-            # Register symbol and add existing data
-            symbol_repo = SymbolRepository(db)
-            symbol = await symbol_repo.register("BTC/USDT")
-            price_repo = PriceRepository(db)
+    @pytest.fixture
+    async def setup_with_data(self, setup):
+        """Create test setup with BTC/USDT registered and no price data yet."""
+        service, mock_client, db, symbol_repo, price_repo = setup
 
-            yield service, mock_client, db, symbol, price_repo
+        # Most tests backfill BTC/USDT, so register it here once
+        symbol = await symbol_repo.register("BTC/USDT")
 
-            await db.close()
+        return service, mock_client, db, symbol, price_repo
 
     @pytest.mark.asyncio
-    async def test_backfill_symbol_success(self, setup):
+    async def test_backfill_symbol_success(self, setup_with_data):
         """Test successful backfill of a symbol."""
-        service, mock_client, db = setup
-
-        # Register symbol first
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
+        service, mock_client, db, symbol, price_repo = setup_with_data
 
         # Mock the client's fetch_ohlcv (which is called by _fetch_with_retry)
-        # Use timestamps 1 minute apart (60000 ms)
-        # Current time: 1000000000000 (fixed in mock)
-        # until_ms will be: ((1000000000000 // 60000) * 60000) - 60000 = 999999994000
-        base_ts = 999999994000 - 120000  # 2 minutes before until_ms
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[
-            OHLCVData(timestamp=base_ts, open=100.0, high=110.0, low=90.0, close=105.0, volume=1000.0),
-            OHLCVData(timestamp=base_ts + 60000, open=105.0, high=115.0, low=95.0, close=110.0, volume=2000.0),
-            OHLCVData(timestamp=base_ts + 120000, open=110.0, high=120.0, low=100.0, close=115.0, volume=3000.0),
-        ])
+        mock_client.candles = list(_SAMPLE_CANDLES)
 
         result = await service.backfill_symbol("BTC/USDT")
 
@@ -105,68 +105,45 @@ class TestBackfillService:
         assert result['strategy'] == 'full_backfill'
 
         # Verify candles were stored
-        price_repo = PriceRepository(db)
-        symbol = await symbol_repo.get_by_symbol("BTC/USDT")
         count = await price_repo.count(symbol.id)
         assert count == 3
 
     @pytest.mark.asyncio
     async def test_backfill_symbol_not_registered(self, setup):
         """Test that backfill raises error for unregistered symbol."""
-        service, mock_client, db = setup
+        service, mock_client, db, symbol_repo, price_repo = setup
 
         with pytest.raises(ValueError, match="not registered"):
             await service.backfill_symbol("BTC/USDT")
 
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_limit"),
+        [
+            ({}, 6),  # settings.backfill_minutes (5) + 1 for the current candle
+            ({"minutes": 10}, 11),
+        ],
+        ids=["settings_default", "custom_minutes"],
+    )
     @pytest.mark.asyncio
-    async def test_backfill_symbol_custom_minutes(self, setup):
-        """Test backfill with custom minutes parameter."""
-        service, mock_client, db = setup
-
-        # Register symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-
-        # Mock fetch_ohlcv to return empty (just checking parameters)
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
-
-        await service.backfill_symbol("BTC/USDT", minutes=10)
-
-        # Verify fetch was called with correct limit
-        mock_client.fetch_ohlcv.assert_called_once()
-        call_kwargs = mock_client.fetch_ohlcv.call_args[1]
-        assert call_kwargs['limit'] == 11  # 10 + 1
-
-    @pytest.mark.asyncio
-    async def test_backfill_symbol_empty_response(self, setup):
-        """Test backfill with empty API response."""
-        service, mock_client, db = setup
-
-        # Register symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
+    async def test_backfill_call_shapes(self, setup_with_data, kwargs, expected_limit):
+        """Test the fetch request made for an empty history and an empty response."""
+        service, mock_client, db, symbol, price_repo = setup_with_data
 
-        result = await service.backfill_symbol("BTC/USDT")
+        result = await service.backfill_symbol("BTC/USDT", **kwargs)
 
+        # A single fetch through the retry wrapper, which succeeds first time
+        assert len(mock_client.fetch_ohlcv_calls) == 1
+        assert mock_client.fetch_ohlcv_calls[0]['limit'] == expected_limit
         assert result['status'] == 'no_data'
         assert result['records_stored'] == 0
 
     @pytest.mark.asyncio
-    async def test_backfill_timestamp_normalization(self, setup):
+    async def test_backfill_timestamp_normalization(self, setup_with_data):
         """Test that timestamps are rounded to minute boundaries."""
-        service, mock_client, db = setup
-
-        # Register symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
+        service, mock_client, db, symbol, price_repo = setup_with_data
 
-        # Mock with non-minute timestamps
-        # until_ms will be ~1000000000000 - 60000, so use a timestamp that works
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[
-            OHLCVData(timestamp=999999994000, open=100.0, high=110.0, low=90.0, close=105.0, volume=1000.0),
-        ])
+        # Mock with a non-minute timestamp
+        mock_client.candles = [_UNALIGNED_CANDLE]
 
         result = await service.backfill_symbol("BTC/USDT")
 
@@ -175,57 +152,12 @@ class TestBackfillService:
         assert result['records_stored'] == 1
 
     @pytest.mark.asyncio
-    async def test_backfill_uses_settings_default(self, setup):
-        """Test that backfill uses settings.backfill_minutes when not specified."""
-        service, mock_client, db = setup
-
-        # Register symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
-
-        await service.backfill_symbol("BTC/USDT")  # No minutes parameter
-
-        # Verify fetch_ohlcv was called
-        mock_client.fetch_ohlcv.assert_called_once()
-        # Verify limit was set correctly (minutes + 1 for current candle)
-        call_kwargs = mock_client.fetch_ohlcv.call_args[1]
-        assert call_kwargs['limit'] == 6  # 5 (default) + 1
-
-    @pytest.mark.asyncio
-    async def test_backfill_retries_on_network_error(self, setup):
-        """Test that backfill uses retry mechanism.
-
-        Note: The actual retry logic is tested in test_retry.py.
-        Here we just verify the service integrates with it.
-        """
-        service, mock_client, db = setup
-
-        # Register symbol
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-
-        # Mock succeeds immediately
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
-
-        # Should complete without error
-        candles = await service.backfill_symbol("BTC/USDT")
-
-        assert mock_client.fetch_ohlcv.call_count == 1
-
-    @pytest.mark.asyncio
-    async def test_get_backfill_status(self, setup):
+    async def test_get_backfill_status(self, setup_with_data):
         """Test getting backfill status."""
-        service, mock_client, db = setup
-
-        # Register symbol
-        symbol_repo = SymbolRepository(db)
-        symbol = await symbol_repo.register("BTC/USDT")
+        service, mock_client, db, symbol, price_repo = setup_with_data
 
         # Add some price data
-        price_repo = PriceRepository(db)
-        await price_repo.save(symbol.id, 1000000000000, 100.0, 110.0, 90.0, 105.0, 1000.0)
+        await price_repo.save(symbol.id, _FIXED_NOW_MS, 100.0, 110.0, 90.0, 105.0, 1000.0)
 
         status = await service.get_backfill_status("BTC/USDT")
 
@@ -233,12 +165,12 @@ class TestBackfillService:
         assert status['symbol_id'] == symbol.id
         assert status['total_records'] == 1
         assert status['latest_price'] == 105.0
-        assert status['oldest_timestamp'] == 1000000000000
+        assert status['oldest_timestamp'] == _FIXED_NOW_MS
 
     @pytest.mark.asyncio
     async def test_get_backfill_status_not_registered(self, setup):
         """Test status for unregistered symbol."""
-        service, mock_client, db = setup
+        service, mock_client, db, symbol_repo, price_repo = setup
 
         status = await service.get_backfill_status("BTC/USDT")
 
@@ -246,13 +178,9 @@ class TestBackfillService:
         assert "not registered" in status['error']
 
     @pytest.mark.asyncio
-    async def test_get_backfill_status_empty(self, setup):
+    async def test_get_backfill_status_empty(self, setup_with_data):
         """Test status for symbol with no data."""
-        service, mock_client, db = setup
-
-        # Register symbol but no price data
-        symbol_repo = SymbolRepository(db)
-        symbol = await symbol_repo.register("BTC/USDT")
+        service, mock_client, db, symbol, price_repo = setup_with_data
 
         status = await service.get_backfill_status("BTC/USDT")
 
@@ -271,130 +199,79 @@ class TestBackfillService:
         """Test that no action is taken when sufficient history exists and no gap."""
         service, mock_client, db, symbol, price_repo = setup_with_data
 
-        # Add 10 minutes of continuous data (more than backfill_minutes=5)
-        # Current time: 1000000000000
-        # until_ms: 999999994000 (previous complete minute)
-        base_ts = 999999994000 - 600000  # 10 minutes before until_ms
-        for i in range(10):
-            await price_repo.save(
-                symbol.id,
-                base_ts + (i * 60000),  # Every minute
-                100.0 + i, 110.0 + i, 90.0 + i, 105.0 + i, 1000.0
-            )
-
-        # Mock should not be called since no backfill is needed
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
+        # Add 10 minutes of continuous data up to until_ms (more than backfill_minutes=5)
+        await price_repo.save_many(
+            symbol.id, _minute_candles(_UNTIL_MS - 9 * _MINUTE_MS, 10)
+        )
 
         result = await service.backfill_symbol("BTC/USDT")
 
         assert result['status'] == 'no_action'
         assert result['reason'] == 'sufficient_history'
-        mock_client.fetch_ohlcv.assert_not_called()
-
+        # No fetch since no backfill is needed
+        assert mock_client.fetch_ohlcv_calls == []
+
+    @pytest.mark.parametrize(
+        ("n_rows", "gap_minutes", "expected_strategy"),
+        [
+            # No existing data
+            (0, 0, 'full_backfill'),
+            # Continuous, but only 1 minute of history (< backfill_minutes=5)
+            (2, 0, 'extend_backward'),
+            # Gap (2 min) + existing (0 min) still short of the required 5 min
+            (1, 2, 'gap_plus_extend'),
+            # Clock skew: the newest row is after "now", treated as continuous
+            (1, -2, 'extend_backward'),
+        ],
+        ids=['no_existing_data', 'extend_backward', 'gap_plus_extend', 'clock_skew'],
+    )
     @pytest.mark.asyncio
-    async def test_gap_fill_extend_backward(self, setup_with_data):
-        """Test extending backward when continuous but insufficient history."""
+    async def test_gap_fill_strategy(
+        self, setup_with_data, n_rows, gap_minutes, expected_strategy
+    ):
+        """Test which strategy is chosen for the existing history and gap."""
         service, mock_client, db, symbol, price_repo = setup_with_data
 
-        # Add only 2 minutes of data (less than backfill_minutes=5)
-        base_ts = 999999994000 - 120000  # 2 minutes before until_ms
-        for i in range(2):
-            await price_repo.save(
-                symbol.id,
-                base_ts + (i * 60000),
-                100.0 + i, 110.0 + i, 90.0 + i, 105.0 + i, 1000.0
-            )
-
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
+        # The newest row sits gap_minutes before until_ms
+        start_ts = _UNTIL_MS - (gap_minutes + n_rows - 1) * _MINUTE_MS
+        await price_repo.save_many(symbol.id, _minute_candles(start_ts, n_rows))
 
         result = await service.backfill_symbol("BTC/USDT")
 
-        assert result['status'] == 'no_data'  # No data returned from mock
-        assert result['strategy'] == 'extend_backward'
+        assert result['status'] == 'no_data'  # No data returned from the fake
+        assert result['strategy'] == expected_strategy
 
     @pytest.mark.asyncio
     async def test_gap_fill_gap_only(self, setup_with_data):
         """Test filling only the gap when sufficient history exists."""
         service, mock_client, db, symbol, price_repo = setup_with_data
 
-        # Calculate timestamps based on current mock time
-        # Current time: 1000000000000
-        # until_ms: ((1000000000000 // 60000) * 60000) - 60000 = 999999900000
-        until_ms = 999999900000
-
-        # Add 10 minutes of data ending 5 minutes ago (gap of 5 minutes)
-        # Latest data should be at: until_ms - 300000 (5 min gap) = 999999600000
-        # So data runs from 999999000000 to 999999540000 (10 minutes)
-        base_ts = until_ms - 600000 - 300000  # 10 minutes of data, 5 min gap
-        for i in range(10):
-            await price_repo.save(
-                symbol.id,
-                base_ts + (i * 60000),
-                100.0 + i, 110.0 + i, 90.0 + i, 105.0 + i, 1000.0
-            )
-
-        # Should fetch only the 5-minute gap
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
+        # Add 10 minutes of data, the newest 6 minutes before until_ms
+        latest_ts = _UNTIL_MS - 6 * _MINUTE_MS
+        await price_repo.save_many(
+            symbol.id, _minute_candles(latest_ts - 9 * _MINUTE_MS, 10)
+        )
 
         result = await service.backfill_symbol("BTC/USDT")
 
         assert result['strategy'] == 'gap_only'
-        # Verify fetch was called with limited window (gap only)
-        call_args = mock_client.fetch_ohlcv.call_args[1]
-        # Since: last_data + 1min = 999999540000 + 60000 = 999999600000
-        assert call_args['since'] == 999999600000
-
-    @pytest.mark.asyncio
-    async def test_gap_fill_gap_plus_extend(self, setup_with_data):
-        """Test filling gap plus extending when combined history is insufficient."""
-        service, mock_client, db, symbol, price_repo = setup_with_data
-
-        # Add 2 minutes of data ending 3 minutes ago (gap of 3 minutes)
-        # Total: 5 minutes, which meets backfill_minutes=5
-        # But let's do 1 minute of data with 2 minute gap = 3 minutes total < 5
-        base_ts = 999999994000 - 60000 - 120000  # 1 min data, 2 min gap
-        for i in range(1):
-            await price_repo.save(
-                symbol.id,
-                base_ts + (i * 60000),
-                100.0, 110.0, 90.0, 105.0, 1000.0
-            )
-
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
-
-        result = await service.backfill_symbol("BTC/USDT")
-
-        # Gap (2 min) + existing (1 min) = 3 min < required (5 min)
-        # Should extend backward
-        assert result['strategy'] == 'gap_plus_extend'
-
-    @pytest.mark.asyncio
-    async def test_gap_fill_full_backfill_no_existing_data(self, setup):
-        """Test full backfill when no existing data."""
-        service, mock_client, db = setup
-
-        # Register symbol but no data
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
-
-        result = await service.backfill_symbol("BTC/USDT")
-
-        assert result['strategy'] == 'full_backfill'
+        # Verify only the gap is fetched, starting right after the last stored candle
+        assert mock_client.fetch_ohlcv_calls[-1]['since'] == latest_ts + _MINUTE_MS
 
     @pytest.mark.asyncio
     async def test_gap_fill_disabled(self, setup_with_data):
         """Test that when gap_fill_enabled is False, it does standard backfill."""
         service, mock_client, db, symbol, price_repo = setup_with_data
 
-        # Modify settings to disable gap fill
-        service._settings.gap_fill_enabled = False
+        # Disable gap fill; model_copy skips validation and leaves the shared settings alone
+        service = BackfillService(
+            mock_client, db, _TEST_SETTINGS.model_copy(update={"gap_fill_enabled": False})
+        )
 
         # Add some existing data
-        await price_repo.save(symbol.id, 999999994000 - 600000, 100.0, 110.0, 90.0, 105.0, 1000.0)
-
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
+        await price_repo.save(
+            symbol.id, _UNTIL_MS - 10 * _MINUTE_MS, 100.0, 110.0, 90.0, 105.0, 1000.0
+        )
 
         # When gap_fill_enabled is False, we still use the same logic
         # but it should work normally
@@ -409,57 +286,62 @@ class TestBackfillService:
         service, mock_client, db, symbol, price_repo = setup_with_data
 
         # Set small max gap
-        service._settings.max_gap_fill_minutes = 10
+        service = BackfillService(
+            mock_client, db, _TEST_SETTINGS.model_copy(update={"max_gap_fill_minutes": 10})
+        )
 
         # Add old data with a 100-minute gap
-        old_ts = 999999994000 - 6000000  # 100 minutes before until_ms
+        old_ts = _UNTIL_MS - 100 * _MINUTE_MS
         await price_repo.save(symbol.id, old_ts, 100.0, 110.0, 90.0, 105.0, 1000.0)
 
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
-
         result = await service.backfill_symbol("BTC/USDT")
 
         # Should be limited
         assert '_limited' in result['strategy']
 
     @pytest.mark.asyncio
-    async def test_gap_fill_clock_skew(self, setup_with_data):
-        """Test handling of clock skew (negative gap)."""
-        service, mock_client, db, symbol, price_repo = setup_with_data
-
-        # Add data in the "future" (after current time)
-        # This simulates clock skew where DB has newer data than "now"
-        future_ts = 1000000000000 + 60000  # 1 minute in the future
-        await price_repo.save(symbol.id, future_ts, 100.0, 110.0, 90.0, 105.0, 1000.0)
+    async def test_backfill_all_symbols(self, setup):
+        """Test backfilling all active symbols."""
+        service, mock_client, db, symbol_repo, price_repo = setup
 
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
+        # Register multiple symbols
+        await symbol_repo.register_many(["BTC/USDT", "ETH/USDT"])
 
-        result = await service.backfill_symbol("BTC/USDT")
+        results = await service.backfill_all_symbols()
 
-        # Should treat as continuous and extend backward (since insufficient history)
-        assert result['strategy'] == 'extend_backward'
+        assert len(results) == 2
+        assert all(r['symbol'] in ["BTC/USDT", "ETH/USDT"] for r in results)
 
     @pytest.mark.asyncio
-    async def test_backfill_all_symbols(self, setup):
-        """Test backfilling all active symbols."""
-        service, mock_client, db = setup
+    async def test_backfill_all_symbols_runs_concurrently(self, setup):
+        """Test that symbols are backfilled concurrently, not one after another."""
+        service, mock_client, db, symbol_repo, price_repo = setup
 
-        # Register multiple symbols
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-        await symbol_repo.register("ETH/USDT")
+        await symbol_repo.register_many(["BTC/USDT", "ETH/USDT"])
+
+        # Each fetch waits until both have started; run serially, the
+        # first one would time out and report an error
+        started = 0
+        both_started = asyncio.Event()
 
-        mock_client.fetch_ohlcv = AsyncMock(return_value=[])
+        async def fetch_when_both_started(**kwargs):
+            nonlocal started
+            started += 1
+            if started == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return []
+
+        mock_client.fetch_ohlcv = AsyncMock(side_effect=fetch_when_both_started)
 
         results = await service.backfill_all_symbols()
 
-        assert len(results) == 2
-        assert all(r['symbol'] in ["BTC/USDT", "ETH/USDT"] for r in results)
+        assert [r['status'] for r in results] == ['no_data', 'no_data']
 
     @pytest.mark.asyncio
     async def test_backfill_all_symbols_no_symbols(self, setup):
         """Test backfilling when no symbols exist."""
-        service, mock_client, db = setup
+        service, mock_client, db, symbol_repo, price_repo = setup
 
         results = await service.backfill_all_symbols()
 
@@ -468,23 +350,23 @@ class TestBackfillService:
     @pytest.mark.asyncio
     async def test_backfill_all_symbols_with_error(self, setup):
         """Test backfilling continues even if one symbol fails."""
-        service, mock_client, db = setup
+        service, mock_client, db, symbol_repo, price_repo = setup
 
         # Register multiple symbols
-        symbol_repo = SymbolRepository(db)
-        await symbol_repo.register("BTC/USDT")
-        await symbol_repo.register("ETH/USDT")
+        await symbol_repo.register_many(["BTC/USDT", "ETH/USDT"])
+
+        # Fail by symbol rather than call order; symbols are backfilled concurrently
+        async def fake_fetch(symbol, **kwargs):
+            if symbol == "BTC/USDT":
+                raise Exception("Network error")
+            return []
 
-        # Mock fails for first call, succeeds for second
-        mock_client.fetch_ohlcv = AsyncMock(side_effect=[
-            Exception("Network error"),
-            [],
-        ])
+        mock_client.fetch_ohlcv = fake_fetch
 
         results = await service.backfill_all_symbols()
 
         assert len(results) == 2
-        # First symbol should have error status
-        error_results = [r for r in results if r['status'] == 'error']
-        assert len(error_results) == 1
-        assert 'Network error' in error_results[0]['error']
+        by_symbol = {r['symbol']: r for r in results}
+        assert by_symbol["BTC/USDT"]['status'] == 'error'
+        assert 'Network error' in by_symbol["BTC/USDT"]['error']
+        assert by_symbol["ETH/USDT"]['status'] == 'no_data'
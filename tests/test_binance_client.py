@@ -8,10 +8,29 @@ from trading_system.clients import BinanceClient
 from trading_system.config import Settings
 
 
+def _ohlcv_rows(count, base_ts, step_ms=60000):
+    """Build ``count`` raw CCXT OHLCV rows, one per ``step_ms``."""
+    return [
+        [base_ts + i * step_ms, 100.0 + i, 110.0 + i, 90.0 + i, 105.0 + i, 1000.0 + i]
+        for i in range(count)
+    ]
+
+
+def _make_mock_exchange():
+    """Build a mock CCXT exchange with markets loaded."""
+    mock_exchange = AsyncMock()
+    mock_exchange.load_markets = AsyncMock()
+    mock_exchange.close = AsyncMock()
+    # milliseconds is called as a method but we need it to return a value directly
+    mock_exchange.milliseconds = MagicMock(return_value=1234567890000)
+    mock_exchange.markets = {'BTC/USDT': {}, 'ETH/USDT': {}}
+    return mock_exchange
+
+
 class TestBinanceClient:
     """Tests for BinanceClient class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def settings(self):
         """Create test settings."""
         return Settings(
@@ -19,26 +38,33 @@ class TestBinanceClient:
             binance_api_secret="test_secret"
         )
 
-    @pytest.fixture
-    async def client(self, settings):
-        """Create a mocked BinanceClient."""
-        with patch('trading_system.clients.binance_client.ccxt.binance') as mock_ccxt:
-            # Setup mock exchange
-            mock_exchange = AsyncMock()
-            mock_exchange.load_markets = AsyncMock()
-            mock_exchange.close = AsyncMock()
-            # milliseconds is called as a method but we need it to return a value directly
-            mock_exchange.milliseconds = MagicMock(return_value=1234567890000)
-            mock_exchange.markets = {'BTC/USDT': {}, 'ETH/USDT': {}}
+    @pytest.fixture(scope="class")
+    async def shared_client(self, settings):
+        """Create one mocked BinanceClient for the class.
 
-            mock_ccxt.return_value = mock_exchange
+        CCXT is only patched while the client initializes; tests that check
+        initialize/close themselves build their own client.
+        """
+        with patch('trading_system.clients.binance_client.ccxt.binance') as mock_ccxt:
+            mock_ccxt.return_value = _make_mock_exchange()
 
             client = BinanceClient(settings)
             await client.initialize()
 
-            yield client, mock_exchange
+        yield client
 
-            await client.close()
+        await client.close()
+
+    @pytest.fixture
+    def client(self, shared_client):
+        """Provide the shared client with a fresh exchange mock for this test.
+
+        Tests replace methods and set return values on the mock, and
+        reset_mock() would keep those, so each test gets a new one.
+        """
+        mock_exchange = _make_mock_exchange()
+        shared_client._exchange = mock_exchange
+        return shared_client, mock_exchange
 
     @pytest.mark.asyncio
     async def test_initialization_creates_exchange(self, settings):
@@ -73,6 +99,51 @@ class TestBinanceClient:
 
             await client.close()
 
+    @pytest.mark.asyncio
+    async def test_initialization_uses_pooled_session(self, settings):
+        """Test that CCXT gets a keep-alive session which close() releases."""
+        with patch('trading_system.clients.binance_client.ccxt.binance') as mock_ccxt:
+            mock_exchange = AsyncMock()
+            mock_ccxt.return_value = mock_exchange
+
+            client = BinanceClient(settings)
+            await client.initialize()
+
+            session = mock_ccxt.call_args.args[0]['session']
+            assert session is client._session
+            assert session.connector.limit == 10
+
+            await client.close()
+
+            assert session.closed
+            assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_initialization_overrides_base_url(self):
+        """Test that binance_base_url redirects every API host."""
+        settings = Settings(
+            binance_api_key="test_key",
+            binance_api_secret="test_secret",
+            binance_base_url="http://127.0.0.1:8080/"
+        )
+        with patch('trading_system.clients.binance_client.ccxt.binance') as mock_ccxt:
+            mock_exchange = AsyncMock()
+            mock_exchange.urls = {'api': {
+                'public': 'https://api.binance.com/api/v3',
+                'fapiPublic': 'https://fapi.binance.com/fapi/v1',
+            }}
+            mock_ccxt.return_value = mock_exchange
+
+            client = BinanceClient(settings)
+            await client.initialize()
+
+            assert mock_exchange.urls['api'] == {
+                'public': 'http://127.0.0.1:8080/api/v3',
+                'fapiPublic': 'http://127.0.0.1:8080/fapi/v1',
+            }
+
+            await client.close()
+
     @pytest.mark.asyncio
     async def test_fetch_ticker_returns_normalized_data(self, client):
         """Test that fetch_ticker returns normalized TickerData."""
@@ -185,6 +256,21 @@ class TestBinanceClient:
             limit=3
         )
 
+    @pytest.mark.asyncio
+    async def test_fetch_ohlcv_full_page(self, client):
+        """Test that a full 1000-candle page keeps every row in order."""
+        client_obj, mock_exchange = client
+
+        rows = _ohlcv_rows(1000, base_ts=1_000_000_000_000)
+        mock_exchange.fetch_ohlcv = AsyncMock(return_value=rows)
+
+        candles = await client_obj.fetch_ohlcv("BTC/USDT", limit=1000)
+
+        assert len(candles) == 1000
+        assert [c.timestamp for c in candles] == [row[0] for row in rows]
+        assert candles[-1].close == rows[-1][4]
+        assert candles[-1].volume == rows[-1][5]
+
     @pytest.mark.asyncio
     async def test_fetch_ohlcv_default_parameters(self, client):
         """Test that fetch_ohlcv uses correct defaults."""
@@ -1,51 +1,44 @@
 """Tests for HeartbeatCoordinator."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from trading_system.clients import BinanceClient
 from trading_system.config import Settings
-from trading_system.database import DatabaseManager
 from trading_system.heartbeat.coordinator import HeartbeatCoordinator
+from trading_system.heartbeat.price_fetcher import PriceFetchResult
+from trading_system.repositories import SymbolRepository
 
 
 class TestHeartbeatCoordinator:
     """Tests for HeartbeatCoordinator class."""
 
     @pytest.fixture
-    async def setup(self):
+    async def setup(self, clean_db):
         """Create test setup with mocked components."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create database
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
+        db = clean_db
 
-            # Create settings
-            settings = Settings(
-                binance_api_key="test_key",
-                binance_api_secret="test_secret",
-                heartbeat_interval=60,
-                heartbeat_buffer_delay=5
-            )
+        # Create settings
+        settings = Settings(
+            binance_api_key="test_key",
+            binance_api_secret="test_secret",
+            heartbeat_interval=60,
+            heartbeat_buffer_delay=5
+        )
 
-            # Create mocked Binance client
-            mock_client = MagicMock(spec=BinanceClient)
+        # Create mocked Binance client
+        mock_client = MagicMock(spec=BinanceClient)
 
-            # Patch the log manager to avoid file operations
-            with patch('trading_system.heartbeat.coordinator.log_manager') as mock_log_manager:
-                mock_logger = MagicMock()
-                mock_log_manager.get_heartbeat_logger.return_value = mock_logger
+        # Patch the log manager to avoid file operations
+        with patch('trading_system.heartbeat.coordinator.log_manager') as mock_log_manager:
+            mock_logger = MagicMock()
+            mock_log_manager.get_heartbeat_logger.return_value = mock_logger
 
-                # Create coordinator
-                coordinator = HeartbeatCoordinator(mock_client, db, settings)
+            # Create coordinator
+            coordinator = HeartbeatCoordinator(mock_client, db, settings)
 
-                yield coordinator, mock_client, db, settings, mock_logger
-
-            await db.close()
+            yield coordinator, mock_client, db, settings, mock_logger
 
     @pytest.mark.asyncio
     async def test_initialization(self, setup):
@@ -59,6 +52,17 @@ class TestHeartbeatCoordinator:
         assert coordinator._scheduler is not None
         assert coordinator._price_fetcher is not None
 
+    @pytest.mark.asyncio
+    async def test_initialization_shares_symbol_repository(self, setup):
+        """Test that a given symbol repository is used by the price fetcher."""
+        _, mock_client, db, settings, _ = setup
+        symbol_repo = SymbolRepository(db)
+
+        with patch('trading_system.heartbeat.coordinator.log_manager'):
+            coordinator = HeartbeatCoordinator(mock_client, db, settings, symbol_repo=symbol_repo)
+
+        assert coordinator._price_fetcher._symbol_repo is symbol_repo
+
     @pytest.mark.asyncio
     async def test_start_sets_running(self, setup):
         """Test that start() sets running state."""
@@ -105,12 +109,10 @@ class TestHeartbeatCoordinator:
         coordinator, mock_client, db, _, mock_logger = setup
 
         # Register a symbol
-        from trading_system.repositories import SymbolRepository
         symbol_repo = SymbolRepository(db)
         await symbol_repo.register("BTC/USDT")
 
         # Mock price fetcher
-        from trading_system.heartbeat.price_fetcher import PriceFetchResult
         mock_results = [
             PriceFetchResult(symbol="BTC/USDT", price=50000.0, timestamp=1234567890000, success=True)
         ]
@@ -128,7 +130,6 @@ class TestHeartbeatCoordinator:
         coordinator, _, _, _, mock_logger = setup
 
         # Mock price fetcher results
-        from trading_system.heartbeat.price_fetcher import PriceFetchResult
         mock_results = [
             PriceFetchResult(symbol="BTC/USDT", price=50000.0, timestamp=1234567890000, success=True),
             PriceFetchResult(symbol="ETH/USDT", price=3000.0, timestamp=1234567890000, success=True)
@@ -147,7 +148,6 @@ class TestHeartbeatCoordinator:
         coordinator, _, _, _, mock_logger = setup
 
         # Mock price fetcher results with failure
-        from trading_system.heartbeat.price_fetcher import PriceFetchResult
         mock_results = [
             PriceFetchResult(symbol="BTC/USDT", price=50000.0, timestamp=1234567890000, success=True),
             PriceFetchResult(symbol="ETH/USDT", price=None, timestamp=None, success=False, error="API Error")
@@ -216,7 +216,6 @@ class TestHeartbeatCoordinator:
         coordinator._scheduler._buffer_delay = 0.05
 
         # Mock price fetcher
-        from trading_system.heartbeat.price_fetcher import PriceFetchResult
         mock_results = [PriceFetchResult(symbol="BTC/USDT", price=50000.0, timestamp=1234567890000, success=True)]
 
         with patch.object(coordinator._price_fetcher, 'fetch_all', return_value=mock_results):
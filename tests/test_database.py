@@ -1,8 +1,5 @@
 """Tests for database layer."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from trading_system.database import DatabaseManager
@@ -12,14 +9,13 @@ class TestDatabaseManager:
     """Tests for DatabaseManager class."""
 
     @pytest.fixture
-    async def db(self):
+    async def db(self, tmp_path):
         """Create a temporary database for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
-            yield db
-            await db.close()
+        db_path = tmp_path / "test.db"
+        db = DatabaseManager(db_path)
+        await db.initialize()
+        yield db
+        await db.close()
 
     @pytest.mark.asyncio
     async def test_initialization_creates_database(self, db):
@@ -58,6 +54,21 @@ class TestDatabaseManager:
         assert "idx_symbols_active" in index_names
         assert "idx_price_data_symbol_time" in index_names
 
+    @pytest.mark.asyncio
+    async def test_reopen_reapplies_schema(self, tmp_path):
+        """Test that reopening an existing database restores missing schema objects."""
+        db_path = tmp_path / "test.db"
+        async with DatabaseManager(db_path) as db:
+            await db.execute("DROP INDEX idx_symbols_active")
+
+        async with DatabaseManager(db_path) as db:
+            rows = await db.fetch_all(
+                "SELECT name FROM sqlite_master WHERE type='index'"
+            )
+
+        # schema.sql runs again and recreates the dropped index
+        assert "idx_symbols_active" in {row["name"] for row in rows}
+
     @pytest.mark.asyncio
     async def test_connection_context_manager(self, db):
         """Test that connection context manager works."""
@@ -89,13 +100,9 @@ class TestDatabaseManager:
     async def test_fetch_all(self, db):
         """Test fetch_all operation."""
         # Insert multiple rows
-        await db.execute(
-            "INSERT INTO symbols (symbol, is_active) VALUES (?, ?)",
-            ("BTC/USDT", 1)
-        )
-        await db.execute(
+        await db.executemany(
             "INSERT INTO symbols (symbol, is_active) VALUES (?, ?)",
-            ("ETH/USDT", 1)
+            [("BTC/USDT", 1), ("ETH/USDT", 1)]
         )
 
         # Fetch all
@@ -117,6 +124,23 @@ class TestDatabaseManager:
 
         assert row is None
 
+    @pytest.mark.asyncio
+    async def test_executemany(self, db):
+        """Test executemany inserts every parameter set and commits."""
+        cursor = await db.executemany(
+            "INSERT INTO symbols (symbol, is_active) VALUES (:symbol, :active)",
+            [
+                {"symbol": "BTC/USDT", "active": 1},
+                {"symbol": "ETH/USDT", "active": 1},
+                {"symbol": "SOL/USDT", "active": 0},
+            ]
+        )
+
+        assert cursor.rowcount == 3
+
+        rows = await db.fetch_all("SELECT symbol FROM symbols ORDER BY symbol")
+        assert [row["symbol"] for row in rows] == ["BTC/USDT", "ETH/USDT", "SOL/USDT"]
+
     @pytest.mark.asyncio
     async def test_execute_with_dict_params(self, db):
         """Test execute with dict parameters."""
@@ -139,16 +163,47 @@ class TestDatabaseManager:
         assert row[0] == 1  # Foreign keys should be enabled
 
     @pytest.mark.asyncio
-    async def test_context_manager(self):
+    async def test_wal_mode_enabled(self, db):
+        """Test that WAL journaling with NORMAL sync is configured."""
+        row = await db.fetch_one("PRAGMA journal_mode")
+        assert row[0] == "wal"
+
+        row = await db.fetch_one("PRAGMA synchronous")
+        assert row[0] == 1  # NORMAL
+
+    @pytest.mark.asyncio
+    async def test_cache_pragmas_configured(self, db):
+        """Test that temp storage, page cache and mmap are tuned."""
+        row = await db.fetch_one("PRAGMA temp_store")
+        assert row[0] == 2  # MEMORY
+
+        row = await db.fetch_one("PRAGMA cache_size")
+        assert row[0] == -64000
+
+        row = await db.fetch_one("PRAGMA mmap_size")
+        assert row[0] == 268435456
+
+    @pytest.mark.asyncio
+    async def test_context_manager(self, tmp_path):
         """Test async context manager."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
+        db_path = tmp_path / "test.db"
+
+        async with DatabaseManager(db_path) as db:
+            assert db._initialized
+            # Should be able to execute queries
+            row = await db.fetch_one("SELECT 1 as test")
+            assert row["test"] == 1
+
+        # After exiting context, connection should be closed
+        assert not db._initialized
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self, tmp_path):
+        """Test that closing an already closed database does nothing."""
+        db = DatabaseManager(tmp_path / "test.db")
+        await db.initialize()
 
-            async with DatabaseManager(db_path) as db:
-                assert db._initialized
-                # Should be able to execute queries
-                row = await db.fetch_one("SELECT 1 as test")
-                assert row["test"] == 1
+        await db.close()
+        await db.close()
 
-            # After exiting context, connection should be closed
-            assert not db._initialized
+        assert not db._initialized
@@ -1,8 +1,6 @@
 """Tests for logging infrastructure."""
 
 import logging
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -41,10 +39,9 @@ class TestLogManager:
         yield
 
     @pytest.fixture
-    def temp_log_dir(self):
+    def temp_log_dir(self, tmp_path):
         """Create a temporary directory for log files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+        return tmp_path
 
     @pytest.fixture
     def settings(self, temp_log_dir):
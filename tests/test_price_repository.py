@@ -1,11 +1,7 @@
 """Tests for PriceRepository."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
-from trading_system.database import DatabaseManager
 from trading_system.repositories import PriceData, PriceRepository, SymbolRepository
 
 
@@ -13,15 +9,9 @@ class TestPriceRepository:
     """Tests for PriceRepository class."""
 
     @pytest.fixture
-    async def repo(self):
-        """Create a PriceRepository with temporary database."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
-            repo = PriceRepository(db)
-            yield repo
-            await db.close()
+    async def repo(self, clean_db):
+        """Create a PriceRepository on the shared in-memory database."""
+        return PriceRepository(clean_db)
 
     @pytest.fixture
     async def symbol_id(self, repo):
@@ -164,6 +154,22 @@ class TestPriceRepository:
         latest = await repo.get_latest(symbol_id)
         assert latest is None
 
+    @pytest.mark.asyncio
+    async def test_get_latest_n(self, repo, symbol_id):
+        """Test getting the N most recent prices, newest first."""
+        candles = [
+            {
+                "timestamp": t, "open": 100.0, "high": 110.0, "low": 90.0,
+                "close": 105.0, "volume": 1.0,
+            }
+            for t in (1000, 2000, 3000, 4000)
+        ]
+        await repo.save_many(symbol_id, candles)
+
+        results = await repo.get_latest_n(symbol_id, 2)
+
+        assert [r.timestamp for r in results] == [4000, 3000]
+
     @pytest.mark.asyncio
     async def test_get_before(self, repo, symbol_id):
         """Test getting prices before a timestamp."""
@@ -1,5 +1,8 @@
 """Test that project setup is working correctly."""
 
+import asyncio
+
+import pytest_asyncio
 
 
 def test_package_imports():
@@ -14,3 +17,18 @@ def test_package_imports():
 
 def test_dev_dependencies():
     """Verify dev dependencies are available."""
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_loop():
+    """The event loop session-scoped async fixtures are created on."""
+    return asyncio.get_running_loop()
+
+
+async def test_async_tests_share_session_loop(session_loop):
+    """Verify async tests run on the session-wide event loop.
+
+    Session fixtures (database, Binance clients) are bound to the loop they
+    were created on, so a per-test loop would break them.
+    """
+    assert asyncio.get_running_loop() is session_loop
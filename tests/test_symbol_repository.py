@@ -1,11 +1,7 @@
 """Tests for SymbolRepository."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
-from trading_system.database import DatabaseManager
 from trading_system.repositories import SymbolRepository
 
 
@@ -13,15 +9,9 @@ class TestSymbolRepository:
     """Tests for SymbolRepository class."""
 
     @pytest.fixture
-    async def repo(self):
-        """Create a SymbolRepository with temporary database."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            db = DatabaseManager(db_path)
-            await db.initialize()
-            repo = SymbolRepository(db)
-            yield repo
-            await db.close()
+    async def repo(self, clean_db):
+        """Create a SymbolRepository on the shared in-memory database."""
+        return SymbolRepository(clean_db)
 
     @pytest.mark.asyncio
     async def test_register_new_symbol(self, repo):
@@ -57,6 +47,39 @@ class TestSymbolRepository:
         assert reactivated.id == symbol.id
         assert reactivated.is_active is True
 
+    @pytest.mark.asyncio
+    async def test_register_many(self, repo):
+        """Test registering several symbols at once."""
+        symbols = await repo.register_many(["ETH/USDT", "BTC/USDT"])
+
+        assert [s.symbol for s in symbols] == ["ETH/USDT", "BTC/USDT"]
+        assert all(s.is_active for s in symbols)
+
+        active = await repo.list_active()
+        assert [s.symbol for s in active] == ["BTC/USDT", "ETH/USDT"]
+
+    @pytest.mark.asyncio
+    async def test_register_many_reactivates_inactive_symbol(self, repo):
+        """Test that register_many reactivates inactive symbols."""
+        symbol = await repo.register("BTC/USDT")
+        await repo.deactivate(symbol.id)
+
+        btc, eth = await repo.register_many(["BTC/USDT", "ETH/USDT"])
+
+        assert btc.id == symbol.id
+        assert btc.is_active is True
+        assert eth.is_active is True
+
+    @pytest.mark.asyncio
+    async def test_register_many_active_duplicate_raises_error(self, repo):
+        """Test that register_many rejects already active symbols without inserting any."""
+        await repo.register("BTC/USDT")
+
+        with pytest.raises(ValueError, match="already registered"):
+            await repo.register_many(["ETH/USDT", "BTC/USDT"])
+
+        assert await repo.get_by_symbol("ETH/USDT") is None
+
     @pytest.mark.asyncio
     async def test_get_by_id(self, repo):
         """Test getting symbol by ID."""
@@ -106,6 +129,68 @@ class TestSymbolRepository:
 
         assert fetched1 is fetched2  # Same object from cache
 
+    @pytest.mark.asyncio
+    async def test_get_by_symbol_without_cache_reads_database(self, repo):
+        """Test that get_by_symbol(use_cache=False) sees changes made behind the cache."""
+        registered = await repo.register("BTC/USDT")
+        cached = await repo.get_by_symbol("BTC/USDT")
+
+        await repo._db.execute(
+            "UPDATE symbols SET last_price = ? WHERE id = ?",
+            (50000.0, registered.id)
+        )
+
+        fresh = await repo.get_by_symbol("BTC/USDT", use_cache=False)
+
+        assert cached.last_price is None
+        assert fresh.last_price == 50000.0
+        assert await repo.get_by_symbol("BTC/USDT") is fresh  # Cache refreshed
+
+    @pytest.mark.asyncio
+    async def test_get_by_symbol_without_cache_keeps_other_entries(self, repo):
+        """Test that a fresh read refreshes one symbol and leaves the rest cached."""
+        btc, eth = await repo.register_many(["BTC/USDT", "ETH/USDT"])
+        await repo.list_active()
+        cached_eth = await repo.get_by_symbol("ETH/USDT")
+
+        await repo._db.execute(
+            "UPDATE symbols SET last_price = ? WHERE id = ?",
+            (50000.0, btc.id)
+        )
+
+        fresh = await repo.get_by_symbol("BTC/USDT", use_cache=False)
+
+        assert await repo.get_by_symbol("ETH/USDT") is cached_eth
+        active = await repo.list_active()
+        assert [s.last_price for s in active] == [50000.0, None]
+        assert active[0] is fresh
+
+    @pytest.mark.asyncio
+    async def test_get_by_symbol_without_cache_drops_deactivated_from_active_list(self, repo):
+        """Test that a fresh read of a deactivated symbol removes it from list_active()."""
+        btc, eth = await repo.register_many(["BTC/USDT", "ETH/USDT"])
+        await repo.list_active()
+
+        await repo._db.execute("UPDATE symbols SET is_active = 0 WHERE id = ?", (btc.id,))
+
+        fresh = await repo.get_by_symbol("BTC/USDT", use_cache=False)
+
+        assert fresh.is_active is False
+        assert [s.symbol for s in await repo.list_active()] == ["ETH/USDT"]
+
+    @pytest.mark.asyncio
+    async def test_get_by_symbol_without_cache_forgets_deleted_row(self, repo):
+        """Test that a fresh read of a deleted symbol drops its cache entries."""
+        btc, eth = await repo.register_many(["BTC/USDT", "ETH/USDT"])
+        await repo.list_active()
+
+        await repo._db.execute("DELETE FROM symbols WHERE id = ?", (btc.id,))
+
+        assert await repo.get_by_symbol("BTC/USDT", use_cache=False) is None
+        assert await repo.get_by_symbol("BTC/USDT") is None
+        assert await repo.get(btc.id) is None
+        assert [s.symbol for s in await repo.list_active()] == ["ETH/USDT"]
+
     @pytest.mark.asyncio
     async def test_get_by_symbol_returns_none_for_missing(self, repo):
         """Test that get_by_symbol() returns None for non-existent symbol."""
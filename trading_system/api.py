@@ -60,7 +60,9 @@ class SymbolCreateResponse(BaseModel):
     message: str
 
 
-def get_db() -> DatabaseManager:
+# Dependencies are async so FastAPI awaits them on the event loop rather
+# than dispatching every resolution to its threadpool
+async def get_db() -> DatabaseManager:
     """Get the current database manager instance.
 
     Raises:
@@ -74,7 +76,7 @@ def get_db() -> DatabaseManager:
     return _db
 
 
-def get_settings() -> Settings:
+async def get_settings() -> Settings:
     """Get the current settings instance.
 
     Raises:
@@ -88,7 +90,7 @@ def get_settings() -> Settings:
     return _settings
 
 
-def get_backfill_service() -> BackfillService:
+async def get_backfill_service() -> BackfillService:
     """Get the current backfill service instance.
 
     Raises:
@@ -347,6 +349,98 @@ async def get_symbol(
     )
 
 
+# Chart layout with log scale Y-axis (identical for every request, built once)
+_PRICE_CHART_LAYOUT = go.Layout(
+    title="Historical Price Data (Log Scale)",
+    xaxis=dict(
+        title="Time",
+        showgrid=True,
+    ),
+    yaxis=dict(
+        title="Price (USD)",
+        type="log",  # Logarithmic scale
+        showgrid=True,
+        tickformat=".2f",
+    ),
+    hovermode="x unified",
+    legend=dict(
+        title="Symbols",
+        orientation="v",
+        yanchor="top",
+        y=1,
+        xanchor="left",
+        x=1.02,
+    ),
+    template="plotly",
+    height=700,
+)
+
+# HTML page around the chart; filled in with str.format per request
+_PLOT_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Trading System - Price Chart</title>
+    <style>
+        body {{
+            margin: 0;
+            padding: 20px;
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            background-color: #f5f5f5;
+        }}
+        h1 {{
+            text-align: center;
+            color: #333;
+            margin-bottom: 10px;
+        }}
+        .subtitle {{
+            text-align: center;
+            color: #666;
+            font-size: 14px;
+            margin-bottom: 20px;
+        }}
+        .chart-container {{
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            padding: 20px;
+        }}
+        .info {{
+            margin-top: 20px;
+            padding: 15px;
+            background: #f9f9f9;
+            border-radius: 4px;
+            font-size: 13px;
+            color: #555;
+        }}
+        .info ul {{
+            margin: 5px 0;
+            padding-left: 20px;
+        }}
+    </style>
+</head>
+<body>
+    <h1>📈 Price Chart</h1>
+    <div class="subtitle">
+        {symbol_count} symbol(s) | Log scale Y-axis | 
+        {point_count:,} data points
+    </div>
+    <div class="chart-container">
+        {chart_div}
+    </div>
+    <div class="info">
+        <strong>💡 Tips:</strong>
+        <ul>
+            <li>Click legend items to show/hide symbols</li>
+            <li>Drag to zoom, double-click to reset</li>
+            <li>Hover for exact values</li>
+            <li>Log scale allows comparing % moves across different price ranges</li>
+        </ul>
+    </div>
+</body>
+</html>"""
+
+
 @app.get("/plot/prices", response_class=HTMLResponse)
 async def plot_prices(
     db: DatabaseManager = Depends(get_db),
@@ -404,34 +498,8 @@ async def plot_prices(
         )
         traces.append(trace)
 
-    # Create layout with log scale Y-axis
-    layout = go.Layout(
-        title="Historical Price Data (Log Scale)",
-        xaxis=dict(
-            title="Time",
-            showgrid=True,
-        ),
-        yaxis=dict(
-            title="Price (USD)",
-            type="log",  # Logarithmic scale
-            showgrid=True,
-            tickformat=".2f",
-        ),
-        hovermode="x unified",
-        legend=dict(
-            title="Symbols",
-            orientation="v",
-            yanchor="top",
-            y=1,
-            xanchor="left",
-            x=1.02,
-        ),
-        template="plotly",
-        height=700,
-    )
-
     # Create figure
-    fig = go.Figure(data=traces, layout=layout)
+    fig = go.Figure(data=traces, layout=_PRICE_CHART_LAYOUT)
 
     # Generate plotly div (just the chart, no full HTML)
     html_content = plot(
@@ -441,68 +509,10 @@ async def plot_prices(
     )
 
     # Wrap in complete HTML document
-    full_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Trading System - Price Chart</title>
-    <style>
-        body {{
-            margin: 0;
-            padding: 20px;
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background-color: #f5f5f5;
-        }}
-        h1 {{
-            text-align: center;
-            color: #333;
-            margin-bottom: 10px;
-        }}
-        .subtitle {{
-            text-align: center;
-            color: #666;
-            font-size: 14px;
-            margin-bottom: 20px;
-        }}
-        .chart-container {{
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            padding: 20px;
-        }}
-        .info {{
-            margin-top: 20px;
-            padding: 15px;
-            background: #f9f9f9;
-            border-radius: 4px;
-            font-size: 13px;
-            color: #555;
-        }}
-        .info ul {{
-            margin: 5px 0;
-            padding-left: 20px;
-        }}
-    </style>
-</head>
-<body>
-    <h1>📈 Price Chart</h1>
-    <div class="subtitle">
-        {len(symbol_data)} symbol(s) | Log scale Y-axis | 
-        {len(rows):,} data points
-    </div>
-    <div class="chart-container">
-        {html_content}
-    </div>
-    <div class="info">
-        <strong>💡 Tips:</strong>
-        <ul>
-            <li>Click legend items to show/hide symbols</li>
-            <li>Drag to zoom, double-click to reset</li>
-            <li>Hover for exact values</li>
-            <li>Log scale allows comparing % moves across different price ranges</li>
-        </ul>
-    </div>
-</body>
-</html>"""
+    full_html = _PLOT_PAGE_TEMPLATE.format(
+        symbol_count=len(symbol_data),
+        point_count=len(rows),
+        chart_div=html_content,
+    )
 
     return full_html
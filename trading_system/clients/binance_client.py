@@ -1,12 +1,23 @@
 """Binance API client using CCXT."""
 
+import re
+import ssl
 from dataclasses import dataclass
 from typing import Any
 
+import aiohttp
 import ccxt.async_support as ccxt
+import certifi
 
 from trading_system.config import Settings
 
+# HTTP connection pool for the Binance REST API. Idle connections are kept
+# past one heartbeat interval so each beat reuses the open TLS connection
+# (aiohttp's default keep-alive is 15s), and DNS answers are cached likewise.
+_MAX_CONNECTIONS = 10
+_KEEPALIVE_TIMEOUT = 75
+_DNS_CACHE_TTL = 300
+
 
 @dataclass
 class TickerData:
@@ -19,9 +30,12 @@ class TickerData:
     volume: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OHLCVData:
-    """Normalized OHLCV candle data."""
+    """Normalized OHLCV candle data.
+
+    Slotted: a backfill builds one per candle, up to a thousand per request.
+    """
     timestamp: int  # Unix timestamp in milliseconds
     open: float
     high: float
@@ -63,6 +77,7 @@ class BinanceClient:
         """
         self._settings = settings
         self._exchange: ccxt.binance | None = None
+        self._session: aiohttp.ClientSession | None = None
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -70,9 +85,11 @@ class BinanceClient:
         if self._initialized:
             return
 
+        self._session = self._create_session()
         self._exchange = ccxt.binance({
             'apiKey': self._settings.binance_api_key,
             'secret': self._settings.binance_api_secret,
+            'session': self._session,
             'enableRateLimit': True,
             'options': {
                 'defaultType': 'spot',
@@ -80,11 +97,34 @@ class BinanceClient:
             }
         })
 
+        if self._settings.binance_base_url:
+            self._override_base_url(self._exchange, self._settings.binance_base_url)
+
         # Load markets to validate connection
         await self._exchange.load_markets()
 
         self._initialized = True
 
+    @staticmethod
+    def _create_session() -> aiohttp.ClientSession:
+        """Create the HTTP session CCXT sends requests through."""
+        connector = aiohttp.TCPConnector(
+            ssl=ssl.create_default_context(cafile=certifi.where()),
+            limit=_MAX_CONNECTIONS,
+            keepalive_timeout=_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=_DNS_CACHE_TTL,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    @staticmethod
+    def _override_base_url(exchange: Any, base_url: str) -> None:
+        """Send every Binance API request to ``base_url`` instead of *.binance.com."""
+        base_url = base_url.rstrip('/')
+        api_urls = exchange.urls['api']
+        for name, url in api_urls.items():
+            if isinstance(url, str):
+                api_urls[name] = re.sub(r'^https://[\w.-]+\.binance\.com', base_url, url)
+
     async def close(self) -> None:
         """Close exchange connection."""
         if self._exchange is not None:
@@ -92,6 +132,11 @@ class BinanceClient:
             self._exchange = None
             self._initialized = False
 
+        # CCXT does not close sessions it was given
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     async def fetch_ticker(self, symbol: str) -> TickerData:
         """Fetch current ticker data for a symbol.
 
@@ -178,17 +223,9 @@ class BinanceClient:
             limit=limit
         )
 
-        return [
-            OHLCVData(
-                timestamp=candle[0],
-                open=candle[1],
-                high=candle[2],
-                low=candle[3],
-                close=candle[4],
-                volume=candle[5]
-            )
-            for candle in ohlcv
-        ]
+        # Rows are [timestamp, open, high, low, close, volume], the field order
+        # of OHLCVData, so build positionally
+        return [OHLCVData(*candle[:6]) for candle in ohlcv]
 
     async def fetch_balance(self) -> dict[str, dict[str, float]]:
         """Fetch account balance.
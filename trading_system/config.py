@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     # Binance API
     binance_api_key: str = Field(min_length=1, description="Binance API key")
     binance_api_secret: str = Field(min_length=1, description="Binance API secret")
+    binance_base_url: str | None = Field(
+        default=None, description="Override for the Binance REST host (e.g. a local stub in tests)"
+    )
 
     # Database
     db_path: Path = Field(default=Path("./data/trading.db"), description="SQLite database file path")
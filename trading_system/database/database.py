@@ -1,6 +1,8 @@
 """Database connection manager using aiosqlite."""
 
+import functools
 import logging
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
@@ -9,6 +11,16 @@ import aiosqlite
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+
+@functools.cache
+def _load_schema_sql() -> str:
+    """Read schema.sql once per process."""
+    if not _SCHEMA_PATH.exists():
+        raise FileNotFoundError(f"Schema file not found: {_SCHEMA_PATH}")
+    return _SCHEMA_PATH.read_text()
+
 
 class DatabaseManager:
     """Manages async SQLite database connections and schema.
@@ -59,6 +71,17 @@ class DatabaseManager:
         # Enable foreign keys
         await self._connection.execute("PRAGMA foreign_keys = ON")
 
+        # WAL lets readers (API, scripts) proceed while the heartbeat writes;
+        # NORMAL sync is durable in WAL mode without an fsync per commit
+        await self._connection.execute("PRAGMA journal_mode = WAL")
+        await self._connection.execute("PRAGMA synchronous = NORMAL")
+
+        # Keep sort/index temp tables in RAM, allow a 64 MB page cache and
+        # memory-map up to 256 MB of the file for reads
+        await self._connection.execute("PRAGMA temp_store = MEMORY")
+        await self._connection.execute("PRAGMA cache_size = -64000")
+        await self._connection.execute("PRAGMA mmap_size = 268435456")
+
         # Initialize schema
         await self._init_schema()
 
@@ -66,16 +89,14 @@ class DatabaseManager:
         logger.info(f"Database initialized: {self._db_path}")
 
     async def _init_schema(self) -> None:
-        """Execute schema.sql to create tables and indexes."""
-        schema_path = Path(__file__).parent / "schema.sql"
-
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
-
-        schema_sql = schema_path.read_text()
+        """Execute schema.sql to create tables and indexes.
 
+        The script is idempotent and runs on every initialize(), so tables
+        and indexes added to it later reach existing databases too. Only
+        reading the file is cached.
+        """
         # Execute schema script
-        await self._connection.executescript(schema_sql)
+        await self._connection.executescript(_load_schema_sql())
         await self._connection.commit()
 
         # Run migrations for existing databases
@@ -175,6 +196,25 @@ class DatabaseManager:
             await conn.commit()
             return cursor
 
+    async def executemany(
+        self,
+        sql: str,
+        seq_of_parameters: Iterable[tuple[Any, ...] | dict[str, Any]]
+    ) -> aiosqlite.Cursor:
+        """Execute a SQL statement once per parameter set in one transaction.
+
+        Args:
+            sql: SQL statement
+            seq_of_parameters: Parameter sets (tuples or dicts)
+
+        Returns:
+            aiosqlite.Cursor: Cursor object
+        """
+        async with self.connection() as conn:
+            cursor: aiosqlite.Cursor = await conn.executemany(sql, seq_of_parameters)
+            await conn.commit()
+            return cursor
+
     async def fetch_one(
         self,
         sql: str,
@@ -212,7 +252,12 @@ class DatabaseManager:
             return await cursor.fetchall()
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connection.
+
+        Safe to call more than once; later calls do nothing. Also required
+        for ``:memory:`` databases: aiosqlite runs each connection on its own
+        non-daemon thread, which only exits when the connection is closed.
+        """
         if self._connection is not None:
             await self._connection.close()
             self._connection = None
@@ -7,6 +7,7 @@ from trading_system.clients import BinanceClient
 from trading_system.config import Settings
 from trading_system.database import DatabaseManager
 from trading_system.logger import log_manager
+from trading_system.repositories import SymbolRepository
 
 from .price_fetcher import PriceFetcher
 from .scheduler import HeartbeatScheduler
@@ -36,7 +37,8 @@ class HeartbeatCoordinator:
         self,
         binance_client: BinanceClient,
         db: DatabaseManager,
-        settings: Settings
+        settings: Settings,
+        symbol_repo: SymbolRepository | None = None
     ) -> None:
         """Initialize heartbeat coordinator.
 
@@ -44,6 +46,8 @@ class HeartbeatCoordinator:
             binance_client: Initialized Binance client
             db: Database manager
             settings: Application settings
+            symbol_repo: Symbol repository to share with the price fetcher;
+                a new one is created if not given
         """
         self._binance = binance_client
         self._db = db
@@ -53,7 +57,7 @@ class HeartbeatCoordinator:
         self._heartbeat_logger = log_manager.get_heartbeat_logger()
 
         # Create price fetcher
-        self._price_fetcher = PriceFetcher(binance_client, db)
+        self._price_fetcher = PriceFetcher(binance_client, db, symbol_repo)
 
         # Create scheduler
         self._scheduler = HeartbeatScheduler(
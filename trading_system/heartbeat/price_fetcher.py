@@ -43,17 +43,20 @@ class PriceFetcher:
     def __init__(
         self,
         binance_client: BinanceClient,
-        db: DatabaseManager
+        db: DatabaseManager,
+        symbol_repo: SymbolRepository | None = None
     ) -> None:
         """Initialize price fetcher.
 
         Args:
             binance_client: Initialized Binance client
             db: Database manager
+            symbol_repo: Symbol repository to share (and share its cache) with
+                other components; a new one is created if not given
         """
         self._binance = binance_client
         self._db = db
-        self._symbol_repo = SymbolRepository(db)
+        self._symbol_repo = symbol_repo or SymbolRepository(db)
         self._price_repo = PriceRepository(db)
 
     async def fetch_all(self) -> list[PriceFetchResult]:
@@ -29,7 +29,7 @@ class PriceData:
             datetime_val = row["datetime"]
         except (KeyError, IndexError):
             pass
-        
+
         return cls(
             id=row["id"],
             symbol_id=row["symbol_id"],
@@ -66,6 +66,9 @@ class PriceRepository:
 
         # Get latest price
         latest = await repo.get_latest(symbol_id)
+
+        # Get the 5 most recent prices
+        recent = await repo.get_latest_n(symbol_id, 5)
     """
 
     def __init__(self, db: DatabaseManager) -> None:
@@ -147,23 +150,21 @@ class PriceRepository:
                 candle["volume"]
             ))
 
-        async with self._db.connection() as conn:
-            # Use executemany for batch insert
-            await conn.executemany(
-                """
-                INSERT INTO price_data 
-                (symbol_id, timestamp, open, high, low, close, volume)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(symbol_id, timestamp) DO UPDATE SET
-                    open = excluded.open,
-                    high = excluded.high,
-                    low = excluded.low,
-                    close = excluded.close,
-                    volume = excluded.volume
-                """,
-                values
-            )
-            await conn.commit()
+        # Use executemany for batch insert
+        await self._db.executemany(
+            """
+            INSERT INTO price_data 
+            (symbol_id, timestamp, open, high, low, close, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(symbol_id, timestamp) DO UPDATE SET
+                open = excluded.open,
+                high = excluded.high,
+                low = excluded.low,
+                close = excluded.close,
+                volume = excluded.volume
+            """,
+            values
+        )
 
         return len(candles)
 
@@ -218,6 +219,28 @@ class PriceRepository:
 
         return PriceData.from_row(row)
 
+    async def get_latest_n(self, symbol_id: int, limit: int) -> list[PriceData]:
+        """Get the most recent price data points for a symbol.
+
+        Args:
+            symbol_id: Symbol database ID
+            limit: Maximum number of records to return
+
+        Returns:
+            List of PriceData ordered by timestamp descending (most recent first)
+        """
+        rows = await self._db.fetch_all(
+            """
+            SELECT * FROM price_data
+            WHERE symbol_id = ?
+            ORDER BY timestamp DESC
+            LIMIT ?
+            """,
+            (symbol_id, limit)
+        )
+
+        return [PriceData.from_row(row) for row in rows]
+
     async def get_oldest(self, symbol_id: int) -> PriceData | None:
         """Get the oldest price data for a symbol.
 
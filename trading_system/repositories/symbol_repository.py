@@ -41,6 +41,9 @@ class SymbolRepository:
         # Register new symbol
         symbol = await repo.register("BTC/USDT")
 
+        # Register several symbols in one transaction
+        symbols = await repo.register_many(["ETH/USDT", "SOL/USDT"])
+
         # Get by ID (cached)
         symbol = await repo.get(1)
 
@@ -102,6 +105,50 @@ class SymbolRepository:
 
         return result
 
+    async def register_many(self, symbols: list[str]) -> list[Symbol]:
+        """Register several symbols in a single transaction.
+
+        More efficient than calling register() multiple times. Inactive
+        symbols are reactivated, as with register().
+
+        Args:
+            symbols: Trading pair symbols (e.g., ["BTC/USDT", "ETH/USDT"])
+
+        Returns:
+            List of registered symbols, in the order given
+
+        Raises:
+            ValueError: If any symbol is already registered and active
+        """
+        if not symbols:
+            return []
+
+        placeholders = ", ".join("?" * len(symbols))
+        active = await self._db.fetch_all(
+            f"SELECT symbol FROM symbols WHERE is_active = 1 AND symbol IN ({placeholders})",
+            tuple(symbols)
+        )
+        if active:
+            names = ", ".join(f"'{row['symbol']}'" for row in active)
+            raise ValueError(f"Symbol(s) {names} already registered and active")
+
+        await self._db.executemany(
+            """
+            INSERT INTO symbols (symbol, is_active) VALUES (?, 1)
+            ON CONFLICT(symbol) DO UPDATE SET is_active = 1
+            """,
+            [(symbol,) for symbol in symbols]
+        )
+
+        self._invalidate_cache()
+
+        rows = await self._db.fetch_all(
+            f"SELECT * FROM symbols WHERE symbol IN ({placeholders})",
+            tuple(symbols)
+        )
+        by_symbol = {row["symbol"]: Symbol.from_row(row) for row in rows}
+        return [by_symbol[symbol] for symbol in symbols]
+
     async def get(self, symbol_id: int) -> Symbol | None:
         """Get symbol by ID.
 
@@ -130,17 +177,19 @@ class SymbolRepository:
 
         return symbol
 
-    async def get_by_symbol(self, symbol: str) -> Symbol | None:
+    async def get_by_symbol(self, symbol: str, use_cache: bool = True) -> Symbol | None:
         """Get symbol by symbol string.
 
         Args:
             symbol: Trading pair symbol (e.g., "BTC/USDT")
+            use_cache: If False, read from the database and refresh this
+                symbol's cache entries without invalidating the others
 
         Returns:
             Symbol or None if not found
         """
         # Check cache
-        if symbol in self._symbol_cache:
+        if use_cache and symbol in self._symbol_cache:
             return self._symbol_cache[symbol]
 
         # Fetch from database
@@ -150,12 +199,29 @@ class SymbolRepository:
         )
 
         if row is None:
+            # Drop entries for a row that no longer exists
+            stale = self._symbol_cache.pop(symbol, None)
+            if stale is not None:
+                self._cache.pop(stale.id, None)
+                self._active_list_cache = None
             return None
 
         result = Symbol.from_row(row)
         self._cache[result.id] = result
         self._symbol_cache[symbol] = result
 
+        # Keep a cached active list consistent: swap the entry in place, or
+        # drop the list if the symbol joined or left the active set
+        if not use_cache and self._active_list_cache is not None:
+            listed = any(cached.id == result.id for cached in self._active_list_cache)
+            if listed != bool(result.is_active):
+                self._active_list_cache = None
+            else:
+                self._active_list_cache = [
+                    result if cached.id == result.id else cached
+                    for cached in self._active_list_cache
+                ]
+
         return result
 
     async def list_active(self) -> list[Symbol]:
@@ -1,6 +1,8 @@
 """Backfill service for fetching historical price data."""
 
+import asyncio
 import logging
+from typing import Any
 
 from tenacity import retry
 
@@ -298,19 +300,11 @@ class BackfillService:
 
         logger.info(f"Starting gap-fill backfill for {len(symbols)} symbols")
 
-        results = []
-        for symbol_obj in symbols:
-            try:
-                result = await self.backfill_symbol(symbol_obj.symbol)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to backfill {symbol_obj.symbol}: {e}")
-                results.append({
-                    'symbol': symbol_obj.symbol,
-                    'status': 'error',
-                    'error': str(e),
-                    'records_stored': 0,
-                })
+        # Symbols are independent, so backfill them concurrently; the client's
+        # rate limiter still spaces out the underlying requests
+        results = await asyncio.gather(*(
+            self._backfill_symbol_or_error(symbol_obj.symbol) for symbol_obj in symbols
+        ))
 
         # Log summary
         success_count = sum(1 for r in results if r['status'] == 'success')
@@ -325,6 +319,26 @@ class BackfillService:
 
         return results
 
+    async def _backfill_symbol_or_error(self, symbol: str) -> dict[str, Any]:
+        """Backfill one symbol, reporting a failure as an error result.
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Backfill result dict, or an error result if the backfill raised
+        """
+        try:
+            return await self.backfill_symbol(symbol)
+        except Exception as e:
+            logger.error(f"Failed to backfill {symbol}: {e}")
+            return {
+                'symbol': symbol,
+                'status': 'error',
+                'error': str(e),
+                'records_stored': 0,
+            }
+
     async def get_backfill_status(self, symbol: str) -> dict:
         """Get backfill status for a symbol.
 